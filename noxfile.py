@@ -33,7 +33,17 @@ def test(session):
 def test_fast(session):
     """Run fast tests (excluding slow tests)."""
     session.install("-e", ".[dev]")
-    session.run("pytest", "tests/", "-v", "--tb=short", "-m", "not slow")
+    # loadfile keeps each module on one xdist worker so module fixtures are shared
+    session.run(
+        "pytest",
+        "tests/",
+        "-v",
+        "--tb=short",
+        "-m",
+        "not slow",
+        "--dist=loadfile",
+        *session.posargs,
+    )
 
 
 @nox.session(python="3.13")
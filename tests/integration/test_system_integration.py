@@ -18,6 +18,9 @@ from lightfast_mcp.core.base_server import ServerConfig
 from tools.orchestration import get_orchestrator, get_registry
 from tools.orchestration.config_loader import ConfigLoader
 
+# Servers started here bind ports 8180-8199. tests/e2e/test_full_system.py binds
+# 8070-8099, and both files can run at once on separate xdist workers.
+
 
 @pytest.mark.integration
 class TestSystemIntegration:
@@ -53,7 +56,7 @@ class TestSystemIntegration:
         test_config = ServerConfig(
             name="integration-test-server",
             description="Integration test server",
-            port=8097,  # Use unique port
+            port=8197,  # Use unique port
             transport="streamable-http",
             config={"type": "mock", "delay_seconds": 0.1},
         )
@@ -74,7 +77,7 @@ class TestSystemIntegration:
             server_info = running_servers["integration-test-server"]
             assert server_info.name == "integration-test-server"
             assert server_info.url is not None
-            assert "8097" in server_info.url
+            assert "8197" in server_info.url
 
             # 5. Test server can be stopped
             stop_result = orchestrator.stop_server("integration-test-server")
@@ -98,14 +101,14 @@ class TestSystemIntegration:
             ServerConfig(
                 name="multi-server-1",
                 description="Multi test server 1",
-                port=8098,
+                port=8198,
                 transport="streamable-http",
                 config={"type": "mock", "delay_seconds": 0.05},
             ),
             ServerConfig(
                 name="multi-server-2",
                 description="Multi test server 2",
-                port=8099,
+                port=8199,
                 transport="streamable-http",
                 config={"type": "mock", "delay_seconds": 0.05},
             ),
@@ -190,7 +193,7 @@ class TestSystemIntegration:
         config = ServerConfig(
             name="perf-test-server",
             description="Performance test server",
-            port=8096,
+            port=8196,
             transport="streamable-http",
             config={"type": "mock", "delay_seconds": 0.01},
         )
@@ -292,7 +295,7 @@ class TestErrorHandlingIntegration:
             ServerConfig(
                 name=f"shutdown-test-{i}",
                 description=f"Shutdown test server {i}",
-                port=8090 + i,
+                port=8190 + i,
                 transport="streamable-http",
                 config={"type": "mock", "delay_seconds": 0.01},
             )
@@ -339,7 +342,7 @@ class TestRealWorldScenarios:
         config = ServerConfig(
             name="cli-test-server",
             description="CLI test server",
-            port=8095,
+            port=8195,
             transport="streamable-http",
             config={"type": "mock", "delay_seconds": 0.05},
         )
@@ -358,7 +361,7 @@ class TestRealWorldScenarios:
             # Test getting URLs
             server_info = running_servers["cli-test-server"]
             assert server_info.url is not None
-            assert "8095" in server_info.url
+            assert "8195" in server_info.url
 
         finally:
             # Cleanup
@@ -408,7 +411,7 @@ class TestRealWorldScenarios:
         config = ServerConfig(
             name="health-test-server",
             description="Health monitoring test server",
-            port=8094,
+            port=8194,
             transport="streamable-http",
             config={"type": "mock", "delay_seconds": 0.01},
         )
@@ -476,7 +479,7 @@ class TestRealWorldScenarios:
             ServerConfig(
                 name=f"concurrent-{i}",
                 description=f"Concurrent test server {i}",
-                port=8080 + i,
+                port=8180 + i,
                 transport="streamable-http",
                 config={"type": "mock", "delay_seconds": 0.01},
             )
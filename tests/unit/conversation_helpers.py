@@ -0,0 +1,48 @@
+"""
+Shared helpers for the conversation client and session unit tests.
+"""
+
+from types import MappingProxyType
+
+from tools.common import OperationStatus, Result
+
+
+class MockMCPTool:
+    """Mock MCP tool for testing."""
+
+    __slots__ = ("name", "description")
+
+    # Shared by every instance, and read-only so no test can leak a mutation
+    inputSchema = MappingProxyType({"type": "object", "properties": {}})
+
+    def __init__(self, name: str, description: str = "Mock tool"):
+        self.name = name
+        self.description = description
+
+
+def success_with(data):
+    """Build a successful Result carrying data."""
+    return Result(status=OperationStatus.SUCCESS, data=data)
+
+
+def failure(error):
+    """Build a failed Result with an error message."""
+    return Result(status=OperationStatus.FAILED, error=error)
+
+
+def async_return(value):
+    """Build a coroutine function returning value, for calls nobody asserts on."""
+
+    async def _return(*args, **kwargs):
+        return value
+
+    return _return
+
+
+def async_raise(error):
+    """Build a coroutine function that raises error, for injected failures."""
+
+    async def _raise(*args, **kwargs):
+        raise error
+
+    return _raise
@@ -2,13 +2,16 @@
 Test cases for BaseServer and related classes.
 """
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import DEFAULT, AsyncMock, patch
 
 import pytest
 
 from lightfast_mcp.core.base_server import BaseServer, ServerConfig, ServerInfo
 
 
+pytestmark = pytest.mark.unit_fast
+
+
 class TestServerConfig:
     """Tests for ServerConfig class."""
 
@@ -132,49 +135,38 @@ class TestBaseServer:
         assert isinstance(info, ServerInfo)
         assert info.config == sample_server_config
 
+    @pytest.mark.parametrize("is_running", [False, True], ids=["stopped", "running"])
     @pytest.mark.asyncio
-    async def test_health_check_stopped(self, sample_server_config):
-        """Test health check when server is stopped."""
-        server = ConcreteTestServer(sample_server_config)
-
-        # Server is not running by default
-        result = await server.health_check()
-        assert result is False
-        assert server.info.is_healthy is False
-
-    @pytest.mark.asyncio
-    async def test_health_check_running(self, sample_server_config):
-        """Test health check when server is running."""
+    async def test_health_check(self, sample_server_config, is_running):
+        """Test that health check reports the server's running state."""
         server = ConcreteTestServer(sample_server_config)
 
-        # Manually set server as running for test
-        server.info.is_running = True
+        # Servers start stopped; mark it running by hand for the running case
+        if is_running:
+            server.info.is_running = True
 
         result = await server.health_check()
-        assert result is True
-        assert server.info.is_healthy is True
+        assert result is is_running
+        assert server.info.is_healthy is is_running
 
     @pytest.mark.asyncio
     async def test_startup_lifecycle(self, sample_server_config):
         """Test server startup lifecycle using lifespan context."""
         server = ConcreteTestServer(sample_server_config)
 
-        # Mock the _on_startup method to avoid actual startup logic
-        with patch.object(
-            server, "_on_startup", new_callable=AsyncMock
-        ) as mock_startup:
-            with patch.object(
-                server, "_on_shutdown", new_callable=AsyncMock
-            ) as mock_shutdown:
-                # Test the lifespan context manager
-                async with server._server_lifespan(server.mcp):
-                    assert server.info.is_running is True
-                    assert server.info.is_healthy is True
-                    mock_startup.assert_called_once()
-
-                # After context, shutdown should have been called
-                mock_shutdown.assert_called_once()
-                assert server.info.is_running is False
+        # Mock the startup and shutdown hooks to avoid actual lifecycle logic
+        with patch.multiple(
+            server, _on_startup=DEFAULT, _on_shutdown=DEFAULT, new_callable=AsyncMock
+        ) as mocks:
+            # Test the lifespan context manager
+            async with server._server_lifespan(server.mcp):
+                assert server.info.is_running is True
+                assert server.info.is_healthy is True
+                mocks["_on_startup"].assert_called_once()
+
+            # After context, shutdown should have been called
+            mocks["_on_shutdown"].assert_called_once()
+            assert server.info.is_running is False
 
     @pytest.mark.asyncio
     async def test_shutdown_lifecycle(self, sample_server_config):
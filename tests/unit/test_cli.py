@@ -15,6 +15,9 @@ from tools.orchestration.cli import (
 )
 
 
+pytestmark = pytest.mark.unit_fast
+
+
 class TestCLI:
     """Test CLI functionality."""
 
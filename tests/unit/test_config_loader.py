@@ -1,16 +1,91 @@
 """
-Additional test cases for the ConfigLoader module.
+Test cases for the ConfigLoader module.
 """
 
+import json
 import os
 import tempfile
+from dataclasses import replace
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
-import yaml
+from pyfakefs.helpers import set_uid
+
+from lightfast_mcp.core.base_server import ServerConfig
+from tools.orchestration.config_loader import (
+    ConfigLoader,
+    load_config_from_env,
+    load_server_configs,
+)
+
+# Shared read-only config for tests that only need "some" server to save
+BASE_SERVER_CONFIG = ServerConfig(
+    name="test", description="test", config={"type": "mock"}
+)
+
+JSON_SERVER_CONFIG = (
+    '{"servers": [{"name": "json-server", "type": "mock", "config": {"type": "mock"}}]}'
+)
+
+SSE_SERVER_YAML = """
+servers:
+  - name: test-server
+    type: mock
+    transport: sse
+    host: localhost
+    port: 8001
+    path: /mcp
+    config:
+      type: mock
+"""
+
+STDIO_SERVER_YAML = """
+servers:
+  - name: stdio-server
+    type: mock
+    transport: stdio
+    config:
+      type: mock
+      command: custom-command
+      args: ["--arg1", "--arg2"]
+"""
+
+STREAMABLE_HTTP_SERVER_YAML = """
+servers:
+  - name: http-server
+    type: mock
+    transport: streamable-http
+    host: example.com
+    port: 9000
+    path: /api
+    config:
+      type: mock
+"""
+
+# One valid server followed by one missing its required name
+VALID_AND_INVALID_SERVERS_YAML = """
+servers:
+  - name: valid-server
+    type: mock
+    config:
+      type: mock
+  - type: mock
+    config:
+      type: mock
+"""
+
+
+@pytest.fixture
+def sample_configs():
+    """Provide a single-server config list backed by the shared base config."""
+    return [BASE_SERVER_CONFIG]
 
-from tools.orchestration.config_loader import ConfigLoader
+
+@pytest.fixture
+def config_dir(fs):
+    """Provide an empty config directory on pyfakefs' in-memory filesystem."""
+    return Path(fs.create_dir("/project/config").path)
 
 
 class TestConfigLoaderComprehensive:
@@ -22,20 +97,19 @@ class TestConfigLoaderComprehensive:
         assert loader.config_dir.name == "config"
         assert loader.config_dir.is_absolute()
 
-    def test_init_custom_config_dir(self):
+    def test_init_custom_config_dir(self, fs):
         """Test initialization with custom config directory."""
         custom_dir = Path("/tmp/custom_config")
         loader = ConfigLoader(config_dir=custom_dir)
         assert loader.config_dir == custom_dir
 
-    def test_config_directory_creation(self):
+    def test_config_directory_creation(self, fs):
         """Test config directory is created during initialization."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_dir = Path(temp_dir) / "test_config"
-            loader = ConfigLoader(config_dir=config_dir)
+        config_dir = Path("/test_config")
+        loader = ConfigLoader(config_dir=config_dir)
 
-            # Directory should be created
-            assert loader.config_dir.exists()
+        # Directory should be created
+        assert loader.config_dir.exists()
 
     def test_parse_server_config_complete(self):
         """Test parsing complete server configuration."""
@@ -104,128 +178,403 @@ class TestConfigLoaderComprehensive:
         assert server_config.name == "test-server"
         assert server_config.config == {"type": "mock"}
 
-    def test_create_sample_config_success(self):
+    def test_create_sample_config_success(self, config_dir):
         """Test successful sample configuration creation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_dir = Path(temp_dir)
-            loader = ConfigLoader(config_dir=config_dir)
+        loader = ConfigLoader(config_dir=config_dir)
 
-            result = loader.create_sample_config("test.yaml")
+        result = loader.create_sample_config("test.yaml")
 
-            assert result is True
-            assert (config_dir / "test.yaml").exists()
+        assert result is True
+        assert (config_dir / "test.yaml").exists()
 
-    def test_create_sample_config_failure(self):
+    def test_create_sample_config_failure(self, fs):
         """Test sample configuration creation failure."""
-        # Use read-only directory to cause write failure
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_dir = Path(temp_dir) / "readonly"
-            config_dir.mkdir()
-            config_dir.chmod(0o444)  # Read-only
-
-            try:
-                loader = ConfigLoader(config_dir=config_dir)
-                _result = loader.create_sample_config("test.yaml")
-                # Result might be True if mkdir worked, but write should fail
-                # The actual behavior depends on system permissions
-            except Exception:
-                # Expected for read-only directories
-                pass
-            finally:
-                # Restore permissions for cleanup
-                config_dir.chmod(0o755)
+        # Emulate a non-root user so the read-only directory is enforced
+        set_uid(1000)
+        config_dir = Path(fs.create_dir("/readonly", perm_bits=0o555).path)
 
-    @patch.dict(
-        os.environ,
-        {
-            "LIGHTFAST_MCP_SERVERS": '{"servers": [{"name": "env-server", "type": "mock", "config": {"type": "mock"}}]}'
-        },
-    )
-    def test_load_from_environment(self):
-        """Test loading configuration from environment variable."""
-        from tools.orchestration.config_loader import load_config_from_env
+        loader = ConfigLoader(config_dir=config_dir)
+        result = loader.create_sample_config("test.yaml")
 
-        configs = load_config_from_env()
+        assert result is False
 
-        assert len(configs) == 1
-        assert configs[0].name == "env-server"
+    def test_load_servers_config_no_file_no_env(self, config_dir):
+        """Test loading when no file or environment config exists."""
+        loader = ConfigLoader(config_dir=config_dir)
 
-    @patch.dict(os.environ, {"LIGHTFAST_MCP_SERVERS": "invalid json"})
-    def test_load_from_environment_invalid_json(self):
-        """Test handling invalid JSON in environment variable."""
-        from tools.orchestration.config_loader import load_config_from_env
+        with patch.dict(os.environ, {}, clear=True):
+            configs = loader.load_servers_config()
 
-        configs = load_config_from_env()
         assert configs == []
 
-    def test_load_servers_config_no_file_no_env(self):
-        """Test loading when no file or environment config exists."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_dir = Path(temp_dir)
-            loader = ConfigLoader(config_dir=config_dir)
+    def test_load_servers_config_with_invalid_server(self, config_dir):
+        """Test loading configuration with one valid and one invalid server."""
+        config_file = config_dir / "servers.yaml"
+
+        # Create config with one valid and one invalid server
+        config_file.write_text(VALID_AND_INVALID_SERVERS_YAML)
+
+        loader = ConfigLoader(config_dir=config_dir)
+        configs = loader.load_servers_config()
+
+        # Should only return the valid server
+        assert len(configs) == 1
+        assert configs[0].name == "valid-server"
+
+    def test_find_config_file_default(self, config_dir):
+        """Test finding default configuration file."""
+        # Create a servers.yaml file
+        (config_dir / "servers.yaml").touch()
+
+        loader = ConfigLoader(config_dir=config_dir)
+        config_file = loader._find_default_config()
+
+        assert config_file.name == "servers.yaml"
+
+    def test_find_config_file_none_found(self, config_dir):
+        """Test when no configuration file is found."""
+        loader = ConfigLoader(config_dir=config_dir)
+
+        config_file = loader._find_default_config()
+
+        assert config_file is None
+
+
+class TestConfigLoaderErrorPaths:
+    """Test error paths and edge cases in ConfigLoader."""
+
+    def test_yaml_not_available_load(self, config_dir):
+        """Test loading YAML when PyYAML is not available."""
+        config_file = config_dir / "servers.yaml"
+
+        # Create a YAML file
+        config_file.write_text("servers:\n  - name: test\n    type: mock")
 
-            with patch.dict(os.environ, {}, clear=True):
-                configs = loader.load_servers_config()
+        loader = ConfigLoader(config_dir=config_dir)
 
+        # Mock YAML_AVAILABLE to False
+        with patch("tools.orchestration.config_loader.YAML_AVAILABLE", False):
+            configs = loader.load_servers_config("servers.yaml")
+            # Should return empty list due to error
             assert configs == []
 
-    def test_load_servers_config_with_invalid_server(self):
-        """Test loading configuration with one valid and one invalid server."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_dir = Path(temp_dir)
-            config_file = config_dir / "servers.yaml"
-
-            # Create config with one valid and one invalid server
-            config_content = {
-                "servers": [
-                    {
-                        "name": "valid-server",
-                        "type": "mock",
-                        "config": {"type": "mock"},
-                    },
-                    {
-                        "type": "mock",  # Missing name
-                        "config": {"type": "mock"},
-                    },
-                ]
+    def test_yaml_not_available_save(self, sample_configs, config_dir):
+        """Test saving YAML when PyYAML is not available."""
+        loader = ConfigLoader(config_dir=config_dir)
+
+        # Mock YAML_AVAILABLE to False
+        with patch("tools.orchestration.config_loader.YAML_AVAILABLE", False):
+            result = loader.save_servers_config(sample_configs, "test.yaml")
+            assert result is False
+
+    def test_unsupported_file_format_load(self, config_dir):
+        """Test loading unsupported file format."""
+        config_file = config_dir / "servers.txt"
+        config_file.write_text("some content")
+
+        loader = ConfigLoader(config_dir=config_dir)
+        configs = loader.load_servers_config("servers.txt")
+        assert configs == []
+
+    def test_unsupported_file_format_save(self, sample_configs, config_dir):
+        """Test saving unsupported file format."""
+        loader = ConfigLoader(config_dir=config_dir)
+
+        result = loader.save_servers_config(sample_configs, "test.txt")
+        assert result is False
+
+    def test_file_not_found(self, config_dir):
+        """Test loading non-existent file."""
+        loader = ConfigLoader(config_dir=config_dir)
+
+        configs = loader.load_servers_config("nonexistent.yaml")
+        assert configs == []
+
+    def test_malformed_json(self, config_dir):
+        """Test loading malformed JSON file."""
+        config_file = config_dir / "servers.json"
+        config_file.write_text("{ invalid json }")
+
+        loader = ConfigLoader(config_dir=config_dir)
+        configs = loader.load_servers_config("servers.json")
+        assert configs == []
+
+    def test_malformed_yaml(self, config_dir):
+        """Test loading malformed YAML file."""
+        config_file = config_dir / "servers.yaml"
+        config_file.write_text("servers:\n  - name: test\n    invalid: [unclosed")
+
+        loader = ConfigLoader(config_dir=config_dir)
+        configs = loader.load_servers_config("servers.yaml")
+        assert configs == []
+
+    def test_invalid_config_data_not_dict(self):
+        """Test parsing config data that's not a dictionary."""
+        loader = ConfigLoader()
+
+        with pytest.raises(ValueError, match="Configuration must be a dictionary"):
+            loader._parse_config_data("not a dict")
+
+    def test_invalid_servers_not_list(self):
+        """Test parsing config where servers is not a list."""
+        loader = ConfigLoader()
+
+        with pytest.raises(ValueError, match="'servers' must be a list"):
+            loader._parse_config_data({"servers": "not a list"})
+
+    def test_invalid_server_config_not_dict(self):
+        """Test parsing server config that's not a dictionary."""
+        loader = ConfigLoader()
+
+        with pytest.raises(
+            ValueError, match="Server configuration must be a dictionary"
+        ):
+            loader._parse_server_config("not a dict")
+
+    def test_save_json_config(self, config_dir):
+        """Test saving JSON configuration."""
+        loader = ConfigLoader(config_dir=config_dir)
+
+        configs = [
+            replace(
+                BASE_SERVER_CONFIG,
+                name="test-server",
+                description="Test server",
+                config={"type": "mock", "delay": 0.5},
+            )
+        ]
+
+        result = loader.save_servers_config(configs, "test.json")
+        assert result is True
+
+        # Verify file was created and has correct content
+        config_file = config_dir / "test.json"
+        assert config_file.exists()
+
+        data = json.loads(config_file.read_text())
+
+        assert "servers" in data
+        assert len(data["servers"]) == 1
+        assert data["servers"][0]["name"] == "test-server"
+
+    def test_load_json_config(self, config_dir):
+        """Test loading JSON configuration."""
+        config_file = config_dir / "servers.json"
+        config_file.write_text(JSON_SERVER_CONFIG)
+
+        loader = ConfigLoader(config_dir=config_dir)
+        configs = loader.load_servers_config("servers.json")
+
+        assert len(configs) == 1
+        assert configs[0].name == "json-server"
+
+    def test_save_config_io_error(self, sample_configs, config_dir):
+        """Test save configuration with IO error."""
+        loader = ConfigLoader(config_dir=config_dir)
+
+        # Try to save to a directory that doesn't exist and can't be created
+        with patch("builtins.open", side_effect=IOError("Permission denied")):
+            result = loader.save_servers_config(sample_configs, "test.yaml")
+            assert result is False
+
+    def test_server_config_to_dict(self):
+        """Test converting ServerConfig to dictionary."""
+        config = ServerConfig(
+            name="test-server",
+            description="Test server",
+            version="2.0.0",
+            host="example.com",
+            port=9000,
+            transport="http",
+            path="/api",
+            config={"type": "custom", "setting": "value"},
+            dependencies=["dep1", "dep2"],
+            required_apps=["app1"],
+        )
+
+        loader = ConfigLoader()
+        result = loader._server_config_to_dict(config)
+
+        expected = {
+            "name": "test-server",
+            "description": "Test server",
+            "version": "2.0.0",
+            "type": "custom",
+            "host": "example.com",
+            "port": 9000,
+            "transport": "http",
+            "path": "/api",
+            "config": {"type": "custom", "setting": "value"},
+            "dependencies": ["dep1", "dep2"],
+            "required_apps": ["app1"],
+        }
+
+        assert result == expected
+
+
+class TestLoadServerConfigs:
+    """Test the convenience function load_server_configs."""
+
+    def test_load_server_configs_with_config_path(self, config_dir):
+        """Test load_server_configs with config/ prefix."""
+        config_file = config_dir / "servers.yaml"
+        config_file.write_text(SSE_SERVER_YAML)
+
+        # The working directory is faked too, so no restore is needed
+        os.chdir(config_dir.parent)
+        servers = load_server_configs("config/servers.yaml")
+
+        assert len(servers) == 1
+        assert "test-server" in servers
+        server = servers["test-server"]
+        assert server["name"] == "test-server"
+        assert server["type"] == "sse"
+        assert server["host"] == "localhost"
+        assert server["port"] == 8001
+
+    def test_load_server_configs_stdio_transport(self, config_dir):
+        """Test load_server_configs with stdio transport."""
+        config_file = config_dir / "servers.yaml"
+
+        config_file.write_text(STDIO_SERVER_YAML)
+
+        loader = ConfigLoader(config_dir=config_dir)
+        # Use the loader directly to avoid path issues
+        server_configs = loader.load_servers_config("servers.yaml")
+
+        # Convert using the same logic as load_server_configs
+        servers = {}
+        for config in server_configs:
+            server_dict = {
+                "name": config.name,
+                "version": config.version,
+                "type": config.transport,
+                "host": config.host,
+                "port": config.port,
+                "path": config.path,
             }
 
-            with open(config_file, "w") as f:
-                yaml.dump(config_content, f)
+            if config.transport == "stdio":
+                server_dict["command"] = config.config.get(
+                    "command", f"lightfast-{config.name.replace('-', '_')}"
+                )
+                server_dict["args"] = config.config.get("args", [])
+
+            servers[config.name] = server_dict
+
+        assert len(servers) == 1
+        server = servers["stdio-server"]
+        assert server["type"] == "stdio"
+        assert server["command"] == "custom-command"
+        assert server["args"] == ["--arg1", "--arg2"]
+
+    def test_load_server_configs_streamable_http(self, config_dir):
+        """Test load_server_configs with streamable-http transport."""
+        config_file = config_dir / "servers.yaml"
+
+        config_file.write_text(STREAMABLE_HTTP_SERVER_YAML)
+
+        loader = ConfigLoader(config_dir=config_dir)
+        server_configs = loader.load_servers_config("servers.yaml")
+
+        # Convert using the same logic as load_server_configs
+        servers = {}
+        for config in server_configs:
+            server_dict = {
+                "name": config.name,
+                "version": config.version,
+                "type": config.transport,
+                "host": config.host,
+                "port": config.port,
+                "path": config.path,
+            }
 
-            loader = ConfigLoader(config_dir=config_dir)
-            configs = loader.load_servers_config()
+            if config.transport in ["sse", "streamable-http"]:
+                server_dict["url"] = f"http://{config.host}:{config.port}{config.path}"
+                if config.transport == "streamable-http":
+                    server_dict["type"] = "sse"
 
-            # Should only return the valid server
-            assert len(configs) == 1
-            assert configs[0].name == "valid-server"
+            servers[config.name] = server_dict
 
-    def test_find_config_file_default(self):
-        """Test finding default configuration file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_dir = Path(temp_dir)
-            # Create a servers.yaml file
-            (config_dir / "servers.yaml").touch()
+        assert len(servers) == 1
+        server = servers["http-server"]
+        assert server["type"] == "sse"  # Mapped from streamable-http
+        assert server["url"] == "http://example.com:9000/api"
 
-            loader = ConfigLoader(config_dir=config_dir)
-            config_file = loader._find_default_config()
+    def test_load_server_configs_no_config_file(self, config_dir):
+        """Test load_server_configs with no config file."""
+        os.chdir(config_dir.parent)
+        servers = load_server_configs()
+        assert servers == {}
 
-            assert config_file.name == "servers.yaml"
 
-    def test_find_config_file_none_found(self):
-        """Test when no configuration file is found."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_dir = Path(temp_dir)
-            loader = ConfigLoader(config_dir=config_dir)
+class TestEnvironmentConfig:
+    """Test environment-based configuration loading."""
 
-            config_file = loader._find_default_config()
+    @patch.dict(
+        os.environ,
+        {
+            "LIGHTFAST_MCP_SERVERS": '{"servers": [{"name": "env-server", "type": "mock", "config": {"type": "mock"}}]}'
+        },
+    )
+    def test_load_config_from_env_single_server(self):
+        """Test loading configuration from environment variable."""
+        configs = load_config_from_env()
+
+        assert len(configs) == 1
+        assert configs[0].name == "env-server"
 
-            assert config_file is None
+    @patch.dict(os.environ, {}, clear=True)
+    def test_load_config_from_env_no_env_var(self):
+        """Test loading from environment when no env var is set."""
+        configs = load_config_from_env()
+        assert configs == []
+
+    @patch.dict(os.environ, {"LIGHTFAST_MCP_SERVERS": "invalid json"})
+    def test_load_config_from_env_invalid_json(self):
+        """Test loading from environment with invalid JSON."""
+        configs = load_config_from_env()
+        assert configs == []
+
+    @patch.dict(os.environ, {"LIGHTFAST_MCP_SERVERS": '{"not_servers": []}'})
+    def test_load_config_from_env_missing_servers_key(self):
+        """Test loading from environment with missing servers key."""
+        configs = load_config_from_env()
+        assert configs == []
+
+    @patch.dict(
+        os.environ,
+        {
+            "LIGHTFAST_MCP_SERVERS": json.dumps(
+                {
+                    "servers": [
+                        {
+                            "name": "env-server-1",
+                            "type": "mock",
+                            "config": {"type": "mock"},
+                        },
+                        {
+                            "name": "env-server-2",
+                            "type": "test",
+                            "config": {"type": "test"},
+                        },
+                    ]
+                }
+            )
+        },
+    )
+    def test_load_config_from_env_multiple_servers(self):
+        """Test loading multiple servers from environment."""
+        configs = load_config_from_env()
+        assert len(configs) == 2
+        assert configs[0].name == "env-server-1"
+        assert configs[1].name == "env-server-2"
 
 
 class TestConfigLoaderIntegration:
     """Integration tests for ConfigLoader."""
 
+    @pytest.mark.slow
     def test_full_config_cycle(self):
         """Test complete configuration creation and loading cycle."""
         with tempfile.TemporaryDirectory() as temp_dir:
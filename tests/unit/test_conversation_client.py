@@ -3,11 +3,22 @@ Comprehensive tests for ConversationClient - critical AI conversation orchestrat
 """
 
 import os
-from unittest.mock import AsyncMock, MagicMock, patch
+import re
+from types import SimpleNamespace
+from unittest.mock import create_autospec, patch
 
 import pytest
 
+from tests.unit.conversation_helpers import (
+    MockMCPTool,
+    async_return,
+    failure,
+    success_with,
+)
 from tools.ai.conversation_client import ConversationClient, create_conversation_client
+from tools.ai.conversation_session import ConversationSession
+from tools.ai.providers.base_provider import BaseAIProvider
+from tools.ai.tool_executor import ToolExecutor
 from tools.common import (
     AIProviderError,
     ConversationResult,
@@ -17,123 +28,241 @@ from tools.common import (
     ToolCall,
     ToolResult,
 )
+from tools.common.async_utils import ConnectionPool
 
 
-class MockMCPTool:
-    """Mock MCP tool for testing."""
+pytestmark = pytest.mark.unit_fast
 
-    def __init__(self, name: str, description: str = "Mock tool"):
-        self.name = name
-        self.description = description
-        self.inputSchema = {"type": "object", "properties": {}}
+# Autospec'd collaborators are costly to build, so each one is created once
+# per module and reset between tests instead of being rebuilt every time.
+_SESSION_TEMPLATE = create_autospec(ConversationSession, instance=True)
+_AI_PROVIDER_TEMPLATE = create_autospec(BaseAIProvider, instance=True)
+_TOOL_EXECUTOR_TEMPLATE = create_autospec(ToolExecutor, instance=True)
+_CONNECTION_POOL_TEMPLATE = create_autospec(ConnectionPool, instance=True)
 
+# Instance attributes set in ConversationSession.__init__, which the class-based
+# autospec does not know about; tests assign them on the shared template
+_SESSION_INSTANCE_ATTRS = ("session_id", "steps")
 
-class TestConversationClient:
-    """Comprehensive tests for ConversationClient class."""
+# Results are only read by the code under test, so one instance can be shared
+_SUCCESS = Result(status=OperationStatus.SUCCESS)
+_PROCESSING_FAILED = Result(status=OperationStatus.FAILED, error="Processing failed")
 
-    @pytest.fixture
-    def sample_servers(self):
-        """Sample server configurations for testing."""
-        return {
-            "server1": {
-                "type": "sse",
-                "url": "http://localhost:8001/mcp",
-                "name": "server1",
-            },
-            "server2": {
-                "type": "stdio",
-                "command": "python",
-                "args": ["-m", "server2"],
-                "name": "server2",
-            },
-        }
+# Tests only count steps, so every session history can repeat this one
+_STEP = ConversationStep(step_number=0, text="Response")
 
-    @pytest.fixture
-    def conversation_client(self, sample_servers):
-        """Create a ConversationClient instance for testing."""
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
-            return ConversationClient(
-                servers=sample_servers,
-                ai_provider="claude",
-                max_steps=3,
-                max_concurrent_tools=2,
-            )
 
-    def test_conversation_client_initialization(
-        self, conversation_client, sample_servers
-    ):
+# Error patterns for pytest.raises, compiled once instead of on every match
+_MISSING_ANTHROPIC_KEY = re.compile("ANTHROPIC_API_KEY")
+_MISSING_OPENAI_KEY = re.compile("OPENAI_API_KEY")
+_UNSUPPORTED_PROVIDER = re.compile("Unsupported AI provider")
+
+# Session-lookup methods are checked against a seeded and a missing session
+_SESSION_LOOKUP = pytest.mark.parametrize(
+    "session_exists", [True, False], ids=["found", "missing"]
+)
+
+
+def _reset_template(template):
+    """Clear recorded calls and configured behaviour from a shared mock."""
+    template.reset_mock(return_value=True, side_effect=True)
+    return template
+
+
+# Snapshots for the read-only getter tests; each test gets a fresh bare client,
+# so these are assigned by reference and never copied.
+_CONNECTED_SERVERS = {"server1": {"type": "sse"}, "server2": {"type": "stdio"}}
+_AVAILABLE_TOOLS = {
+    "tool1": (MockMCPTool("tool1"), "server1"),
+    "tool2": (MockMCPTool("tool2"), "server1"),
+    "tool3": (MockMCPTool("tool3"), "server2"),
+}
+
+
+class MockConnection:
+    """Async context manager standing in for a pooled MCP connection."""
+
+    def __init__(self, client):
+        self.client = client
+
+    async def __aenter__(self):
+        return self.client
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+
+@pytest.fixture(scope="module", autouse=True)
+def api_keys():
+    """Provide fake provider API keys for every test in this module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("ANTHROPIC_API_KEY", "test-key")
+        mp.setenv("OPENAI_API_KEY", "test-key")
+        yield
+
+
+@pytest.fixture
+def mock_session():
+    """Provide the shared autospec'd ConversationSession."""
+    yield _reset_template(_SESSION_TEMPLATE)
+    # reset_mock keeps plain attributes, and autospec would otherwise raise for
+    # these instance-only fields, so drop whatever the test assigned
+    for name in _SESSION_INSTANCE_ATTRS:
+        vars(_SESSION_TEMPLATE).pop(name, None)
+
+
+@pytest.fixture
+def mock_ai_provider():
+    """Provide the shared autospec'd AI provider."""
+    return _reset_template(_AI_PROVIDER_TEMPLATE)
+
+
+@pytest.fixture
+def mock_tool_executor():
+    """Provide the shared autospec'd ToolExecutor."""
+    return _reset_template(_TOOL_EXECUTOR_TEMPLATE)
+
+
+@pytest.fixture
+def mock_pool():
+    """Provide the shared autospec'd ConnectionPool."""
+    return _reset_template(_CONNECTION_POOL_TEMPLATE)
+
+
+@pytest.fixture
+def patched_session_class():
+    """Patch the ConversationSession class used by the client module."""
+    with patch("tools.ai.conversation_client.ConversationSession") as session_class:
+        yield session_class
+
+
+@pytest.fixture(scope="module")
+def sample_servers():
+    """Sample server configurations for testing."""
+    return {
+        "server1": {
+            "type": "sse",
+            "url": "http://localhost:8001/mcp",
+            "name": "server1",
+        },
+        "server2": {
+            "type": "stdio",
+            "command": "python",
+            "args": ["-m", "server2"],
+            "name": "server2",
+        },
+    }
+
+
+@pytest.fixture(scope="module")
+def shared_conversation_client(api_keys, sample_servers):
+    """Build one ConversationClient for the whole module."""
+    return ConversationClient(
+        servers=sample_servers,
+        ai_provider="claude",
+        max_steps=3,
+        max_concurrent_tools=2,
+    )
+
+
+@pytest.fixture
+def conversation_client(shared_conversation_client):
+    """Provide the shared ConversationClient and reset its state after each test."""
+    client = shared_conversation_client
+    ai_provider, tool_executor = client.ai_provider, client.tool_executor
+
+    yield client
+
+    client.ai_provider = ai_provider
+    client.tool_executor = tool_executor
+    client.connection_pool = None
+    client.connected_servers = {}
+    client.available_tools = {}
+    client.active_sessions = {}
+
+
+@pytest.fixture
+def bare_client():
+    """Provide a ConversationClient with only the state the getters read."""
+    client = ConversationClient.__new__(ConversationClient)
+    client.connected_servers = {}
+    client.available_tools = {}
+    client.active_sessions = {}
+    return client
+
+
+class TestConversationClient:
+    """Comprehensive tests for ConversationClient class."""
+
+    def test_conversation_client_initialization(self, sample_servers):
         """Test ConversationClient initialization."""
-        assert conversation_client.servers == sample_servers
-        assert conversation_client.ai_provider_name == "claude"
-        assert conversation_client.max_steps == 3
-        assert conversation_client.max_concurrent_tools == 2
-        assert conversation_client.connection_pool is None
-        assert conversation_client.connected_servers == {}
-        assert conversation_client.available_tools == {}
-        assert conversation_client.active_sessions == {}
-
-    def test_get_api_key_claude(self):
-        """Test getting Claude API key from environment."""
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-claude-key"}):
-            client = ConversationClient(servers={}, ai_provider="claude")
-            assert client.api_key == "test-claude-key"
-
-    def test_get_api_key_openai(self):
-        """Test getting OpenAI API key from environment."""
-        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-openai-key"}):
-            client = ConversationClient(servers={}, ai_provider="openai")
-            assert client.api_key == "test-openai-key"
-
-    def test_get_api_key_missing_claude(self):
-        """Test missing Claude API key raises error."""
-        with patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(AIProviderError, match="ANTHROPIC_API_KEY"):
-                ConversationClient(servers={}, ai_provider="claude")
+        # Built directly: the shared client's teardown resets the state checked
+        # here, so it cannot show what __init__ sets up
+        client = ConversationClient(
+            servers=sample_servers,
+            ai_provider="claude",
+            max_steps=3,
+            max_concurrent_tools=2,
+        )
 
-    def test_get_api_key_missing_openai(self):
-        """Test missing OpenAI API key raises error."""
+        assert client.servers == sample_servers
+        assert client.ai_provider_name == "claude"
+        assert client.max_steps == 3
+        assert client.max_concurrent_tools == 2
+        assert client.connection_pool is None
+        assert client.connected_servers == {}
+        assert client.available_tools == {}
+        assert client.active_sessions == {}
+
+    @pytest.mark.parametrize(
+        "provider, env_var, key",
+        [
+            ("claude", "ANTHROPIC_API_KEY", "test-claude-key"),
+            ("openai", "OPENAI_API_KEY", "test-openai-key"),
+        ],
+    )
+    def test_get_api_key(self, monkeypatch, provider, env_var, key):
+        """Test getting the provider API key from environment."""
+        monkeypatch.setenv(env_var, key)
+        client = ConversationClient(servers={}, ai_provider=provider)
+        assert client.api_key == key
+
+    @pytest.mark.parametrize(
+        "provider, error_pattern",
+        [("claude", _MISSING_ANTHROPIC_KEY), ("openai", _MISSING_OPENAI_KEY)],
+    )
+    def test_get_api_key_missing(self, provider, error_pattern):
+        """Test missing provider API key raises error."""
         with patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(AIProviderError, match="OPENAI_API_KEY"):
-                ConversationClient(servers={}, ai_provider="openai")
+            with pytest.raises(AIProviderError, match=error_pattern):
+                ConversationClient(servers={}, ai_provider=provider)
 
     def test_unsupported_ai_provider(self):
         """Test unsupported AI provider raises error."""
-        with pytest.raises(AIProviderError, match="Unsupported AI provider"):
+        with pytest.raises(AIProviderError, match=_UNSUPPORTED_PROVIDER):
             ConversationClient(servers={}, ai_provider="unsupported")
 
-    def test_create_ai_provider_claude(self, conversation_client):
-        """Test creating Claude AI provider."""
-        provider = conversation_client._create_ai_provider()
-        assert provider.provider_name == "claude"
+    @pytest.mark.parametrize("provider_name", ["claude", "openai"])
+    def test_create_ai_provider(self, sample_servers, provider_name):
+        """Test creating each supported AI provider."""
+        client = ConversationClient(servers=sample_servers, ai_provider=provider_name)
+        provider = client._create_ai_provider()
+        assert provider.provider_name == provider_name
 
-    def test_create_ai_provider_openai(self, sample_servers):
-        """Test creating OpenAI AI provider."""
-        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
-            client = ConversationClient(servers=sample_servers, ai_provider="openai")
-            provider = client._create_ai_provider()
-            assert provider.provider_name == "openai"
-
-    @pytest.mark.asyncio
-    async def test_connect_to_servers_success(self, conversation_client):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_connect_to_servers_success(self, conversation_client, mock_pool):
         """Test successful connection to servers."""
-        # Mock connection pool
-        mock_pool = MagicMock()
-        mock_pool.register_server = AsyncMock()
-
         # Mock client and tools
-        mock_client = MagicMock()
-        mock_tools_result = MagicMock()
-        mock_tools_result.tools = [
-            MockMCPTool("tool1", "First tool"),
-            MockMCPTool("tool2", "Second tool"),
-        ]
-        mock_client.list_tools = AsyncMock(return_value=mock_tools_result)
+        mock_tools_result = SimpleNamespace(
+            tools=[
+                MockMCPTool("tool1", "First tool"),
+                MockMCPTool("tool2", "Second tool"),
+            ]
+        )
+        mock_client = SimpleNamespace(list_tools=async_return(mock_tools_result))
 
         # Mock connection context manager
-        mock_connection = MagicMock()
-        mock_connection.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_connection.__aexit__ = AsyncMock(return_value=None)
-        mock_pool.get_connection.return_value = mock_connection
+        mock_pool.get_connection.return_value = MockConnection(mock_client)
 
         with patch(
             "tools.ai.conversation_client.get_connection_pool", return_value=mock_pool
@@ -147,26 +276,19 @@ class TestConversationClient:
         assert len(conversation_client.connected_servers) == 2
         assert len(conversation_client.available_tools) == 2
 
-    @pytest.mark.asyncio
-    async def test_connect_to_servers_partial_failure(self, conversation_client):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_connect_to_servers_partial_failure(
+        self, conversation_client, mock_pool
+    ):
         """Test connection with some server failures."""
-        # Mock connection pool
-        mock_pool = MagicMock()
-        mock_pool.register_server = AsyncMock()
-
         # Mock successful connection for server1
-        mock_client1 = MagicMock()
-        mock_tools_result = MagicMock()
-        mock_tools_result.tools = [MockMCPTool("tool1")]
-        mock_client1.list_tools = AsyncMock(return_value=mock_tools_result)
+        mock_tools_result = SimpleNamespace(tools=[MockMCPTool("tool1")])
+        mock_client1 = SimpleNamespace(list_tools=async_return(mock_tools_result))
 
         # Mock failed connection for server2
         def mock_get_connection(server_name):
             if server_name == "server1":
-                mock_connection = MagicMock()
-                mock_connection.__aenter__ = AsyncMock(return_value=mock_client1)
-                mock_connection.__aexit__ = AsyncMock(return_value=None)
-                return mock_connection
+                return MockConnection(mock_client1)
             else:
                 raise Exception("Connection failed")
 
@@ -183,21 +305,16 @@ class TestConversationClient:
         assert connection_results["server2"] is False
         assert len(conversation_client.connected_servers) == 1
 
-    @pytest.mark.asyncio
-    async def test_connect_to_servers_tools_list_format(self, conversation_client):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_connect_to_servers_tools_list_format(
+        self, conversation_client, mock_pool
+    ):
         """Test connection with tools returned as list."""
-        mock_pool = MagicMock()
-        mock_pool.register_server = AsyncMock()
-
-        mock_client = MagicMock()
         # Return tools as list instead of object with .tools attribute
         mock_tools_list = [MockMCPTool("tool1"), MockMCPTool("tool2")]
-        mock_client.list_tools = AsyncMock(return_value=mock_tools_list)
+        mock_client = SimpleNamespace(list_tools=async_return(mock_tools_list))
 
-        mock_connection = MagicMock()
-        mock_connection.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_connection.__aexit__ = AsyncMock(return_value=None)
-        mock_pool.get_connection.return_value = mock_connection
+        mock_pool.get_connection.return_value = MockConnection(mock_client)
 
         with patch(
             "tools.ai.conversation_client.get_connection_pool", return_value=mock_pool
@@ -207,12 +324,14 @@ class TestConversationClient:
         assert result.is_success
         assert len(conversation_client.available_tools) == 2
 
-    @pytest.mark.asyncio
-    async def test_start_conversation_success(self, conversation_client):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_start_conversation_success(
+        self, conversation_client, mock_ai_provider, mock_tool_executor
+    ):
         """Test successful conversation start."""
         # Mock AI provider and tool executor
-        conversation_client.ai_provider = MagicMock()
-        conversation_client.tool_executor = MagicMock()
+        conversation_client.ai_provider = mock_ai_provider
+        conversation_client.tool_executor = mock_tool_executor
         conversation_client.available_tools = {
             "tool1": (MockMCPTool("tool1"), "server1")
         }
@@ -224,32 +343,29 @@ class TestConversationClient:
         assert session.session_id in conversation_client.active_sessions
         assert session.max_steps == conversation_client.max_steps
 
-    @pytest.mark.asyncio
-    async def test_start_conversation_with_initial_message(self, conversation_client):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_start_conversation_with_initial_message(
+        self, conversation_client, mock_session, patched_session_class
+    ):
         """Test conversation start with initial message."""
         # Mock session and its process_message method
-        mock_session = MagicMock()
         mock_session.session_id = "test-session"
-        mock_session.process_message = AsyncMock(
-            return_value=Result(status=OperationStatus.SUCCESS)
-        )
+        mock_session.process_message.return_value = _SUCCESS
 
-        with patch(
-            "tools.ai.conversation_client.ConversationSession",
-            return_value=mock_session,
-        ):
-            result = await conversation_client.start_conversation(
-                initial_message="Hello", session_id="test-session"
-            )
+        patched_session_class.return_value = mock_session
+
+        result = await conversation_client.start_conversation(
+            initial_message="Hello", session_id="test-session"
+        )
 
         assert result.is_success
         mock_session.process_message.assert_called_once_with("Hello")
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_start_conversation_duplicate_session(self, conversation_client):
         """Test starting conversation with duplicate session ID."""
         # Add existing session
-        conversation_client.active_sessions["existing-session"] = MagicMock()
+        conversation_client.active_sessions["existing-session"] = SimpleNamespace()
 
         result = await conversation_client.start_conversation(
             session_id="existing-session"
@@ -258,21 +374,18 @@ class TestConversationClient:
         assert result.is_failed
         assert "already exists" in result.error
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_chat_new_session(self, conversation_client):
         """Test chat with new session creation."""
         # Mock session creation and processing
-        mock_session = MagicMock()
-        mock_session.session_id = "new-session"
-        mock_session.steps = [ConversationStep(step_number=0, text="Hello response")]
-        mock_session.process_message = AsyncMock(
-            return_value=Result(status=OperationStatus.SUCCESS)
+        mock_session = SimpleNamespace(
+            session_id="new-session",
+            steps=[_STEP],
+            process_message=async_return(_SUCCESS),
         )
 
         with patch.object(conversation_client, "start_conversation") as mock_start:
-            mock_start.return_value = Result(
-                status=OperationStatus.SUCCESS, data=mock_session
-            )
+            mock_start.return_value = success_with(mock_session)
 
             result = await conversation_client.chat("Hello")
 
@@ -281,89 +394,77 @@ class TestConversationClient:
         assert isinstance(conversation_result, ConversationResult)
         assert len(conversation_result.steps) == 1
 
-    @pytest.mark.asyncio
-    async def test_chat_existing_session(self, conversation_client):
-        """Test chat with existing session."""
-        # Create existing session
-        mock_session = MagicMock()
-        mock_session.session_id = "existing-session"
-        mock_session.steps = [ConversationStep(step_number=0, text="Response")]
-        mock_session.process_message = AsyncMock(
-            return_value=Result(status=OperationStatus.SUCCESS)
-        )
-
-        conversation_client.active_sessions["existing-session"] = mock_session
-
-        result = await conversation_client.chat("Hello", session_id="existing-session")
-
-        assert result.is_success
-        mock_session.process_message.assert_called_once_with("Hello")
-
-    @pytest.mark.asyncio
-    async def test_chat_session_not_found(self, conversation_client):
-        """Test chat with non-existent session."""
-        result = await conversation_client.chat("Hello", session_id="nonexistent")
-
-        assert result.is_failed
-        assert "not found" in result.error
-
-    @pytest.mark.asyncio
-    async def test_continue_conversation(self, conversation_client):
-        """Test continuing an existing conversation."""
-        # Mock existing session
-        mock_session = MagicMock()
-        mock_session.steps = [ConversationStep(step_number=0, text="Response")]
-        mock_session.process_message = AsyncMock(
-            return_value=Result(status=OperationStatus.SUCCESS)
-        )
-
-        conversation_client.active_sessions["test-session"] = mock_session
+    @_SESSION_LOOKUP
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_chat_with_session_id(
+        self, conversation_client, mock_session, session_exists
+    ):
+        """Test chat with an existing or unknown session ID."""
+        mock_session.steps = [_STEP]
+        mock_session.process_message.return_value = _SUCCESS
+        if session_exists:
+            conversation_client.active_sessions["test-session"] = mock_session
+
+        result = await conversation_client.chat("Hello", session_id="test-session")
+
+        if session_exists:
+            assert result.is_success
+            mock_session.process_message.assert_called_once_with("Hello")
+        else:
+            assert result.is_failed
+            assert "not found" in result.error
+            mock_session.process_message.assert_not_called()
+
+    @_SESSION_LOOKUP
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_continue_conversation(
+        self, conversation_client, mock_session, session_exists
+    ):
+        """Test continuing an existing or unknown conversation."""
+        mock_session.steps = [_STEP]
+        mock_session.process_message.return_value = _SUCCESS
+        if session_exists:
+            conversation_client.active_sessions["test-session"] = mock_session
 
         result = await conversation_client.continue_conversation(
             "test-session", "Continue"
         )
 
-        assert result.is_success
-        mock_session.process_message.assert_called_once_with("Continue")
-
-    @pytest.mark.asyncio
-    async def test_get_conversation_history(self, conversation_client):
-        """Test getting conversation history."""
-        # Mock session with steps
-        mock_session = MagicMock()
-        mock_steps = [
-            ConversationStep(step_number=0, text="Step 1"),
-            ConversationStep(step_number=1, text="Step 2"),
-        ]
-        mock_session.steps = mock_steps
-
-        conversation_client.active_sessions["test-session"] = mock_session
+        if session_exists:
+            assert result.is_success
+            mock_session.process_message.assert_called_once_with("Continue")
+        else:
+            assert result.is_failed
+            assert "not found" in result.error
+            mock_session.process_message.assert_not_called()
+
+    @_SESSION_LOOKUP
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_get_conversation_history(self, conversation_client, session_exists):
+        """Test getting history for an existing or unknown session."""
+        if session_exists:
+            conversation_client.active_sessions["test-session"] = SimpleNamespace(
+                steps=[_STEP] * 2
+            )
 
         result = await conversation_client.get_conversation_history("test-session")
 
-        assert result.is_success
-        assert len(result.data) == 2
-
-    @pytest.mark.asyncio
-    async def test_get_conversation_history_not_found(self, conversation_client):
-        """Test getting history for non-existent session."""
-        result = await conversation_client.get_conversation_history("nonexistent")
-
-        assert result.is_failed
-        assert "not found" in result.error
+        if session_exists:
+            assert result.is_success
+            assert len(result.data) == 2
+        else:
+            assert result.is_failed
+            assert "not found" in result.error
 
-    @pytest.mark.asyncio
-    async def test_execute_tools(self, conversation_client):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_execute_tools(self, conversation_client, mock_tool_executor):
         """Test executing tool calls."""
         # Mock tool executor
-        mock_tool_executor = MagicMock()
         mock_results = [
             ToolResult(id="1", tool_name="tool1", arguments={}, result="result1"),
             ToolResult(id="2", tool_name="tool2", arguments={}, result="result2"),
         ]
-        mock_tool_executor.execute_tools_concurrently = AsyncMock(
-            return_value=mock_results
-        )
+        mock_tool_executor.execute_tools_concurrently.return_value = mock_results
         conversation_client.tool_executor = mock_tool_executor
 
         tool_calls = [
@@ -376,7 +477,7 @@ class TestConversationClient:
         assert result.is_success
         assert len(result.data) == 2
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_execute_tools_empty(self, conversation_client):
         """Test executing empty tool calls list."""
         result = await conversation_client.execute_tools([])
@@ -384,25 +485,18 @@ class TestConversationClient:
         assert result.is_success
         assert result.data == []
 
-    def test_get_connected_servers(self, conversation_client):
+    def test_get_connected_servers(self, bare_client):
         """Test getting connected servers list."""
-        conversation_client.connected_servers = {
-            "server1": {"type": "sse"},
-            "server2": {"type": "stdio"},
-        }
+        bare_client.connected_servers = _CONNECTED_SERVERS
 
-        servers = conversation_client.get_connected_servers()
+        servers = bare_client.get_connected_servers()
         assert servers == ["server1", "server2"]
 
-    def test_get_available_tools(self, conversation_client):
+    def test_get_available_tools(self, bare_client):
         """Test getting available tools by server."""
-        conversation_client.available_tools = {
-            "tool1": (MockMCPTool("tool1"), "server1"),
-            "tool2": (MockMCPTool("tool2"), "server1"),
-            "tool3": (MockMCPTool("tool3"), "server2"),
-        }
+        bare_client.available_tools = _AVAILABLE_TOOLS
 
-        tools_by_server = conversation_client.get_available_tools()
+        tools_by_server = bare_client.get_available_tools()
 
         expected = {
             "server1": ["tool1", "tool2"],
@@ -410,79 +504,70 @@ class TestConversationClient:
         }
         assert tools_by_server == expected
 
-    def test_find_tool_server(self, conversation_client):
+    def test_find_tool_server(self, bare_client):
         """Test finding which server has a tool."""
-        conversation_client.available_tools = {
-            "tool1": (MockMCPTool("tool1"), "server1"),
-            "tool2": (MockMCPTool("tool2"), "server2"),
-        }
+        bare_client.available_tools = _AVAILABLE_TOOLS
 
-        assert conversation_client.find_tool_server("tool1") == "server1"
-        assert conversation_client.find_tool_server("tool2") == "server2"
-        assert conversation_client.find_tool_server("nonexistent") is None
+        assert bare_client.find_tool_server("tool1") == "server1"
+        assert bare_client.find_tool_server("tool3") == "server2"
+        assert bare_client.find_tool_server("nonexistent") is None
 
-    def test_get_server_status(self, conversation_client):
+    def test_get_server_status(self, bare_client):
         """Test getting server status information."""
-        conversation_client.connected_servers = {"server1": {}, "server2": {}}
-        conversation_client.available_tools = {
-            "tool1": (MockMCPTool("tool1"), "server1"),
-            "tool2": (MockMCPTool("tool2"), "server1"),
-            "tool3": (MockMCPTool("tool3"), "server2"),
-        }
+        bare_client.connected_servers = _CONNECTED_SERVERS
+        bare_client.available_tools = _AVAILABLE_TOOLS
 
-        status = conversation_client.get_server_status()
+        status = bare_client.get_server_status()
 
         assert len(status) == 2
         assert status["server1"]["connected"] is True
         assert status["server1"]["tools_count"] == 2
         assert status["server2"]["tools_count"] == 1
 
-    def test_get_active_sessions(self, conversation_client):
+    def test_get_active_sessions(self, bare_client):
         """Test getting active sessions."""
-        mock_session1 = MagicMock()
-        mock_session2 = MagicMock()
-        conversation_client.active_sessions = {
+        mock_session1 = SimpleNamespace()
+        mock_session2 = SimpleNamespace()
+        bare_client.active_sessions = {
             "session1": mock_session1,
             "session2": mock_session2,
         }
 
-        sessions = conversation_client.get_active_sessions()
+        sessions = bare_client.get_active_sessions()
 
         assert len(sessions) == 2
         assert sessions["session1"] is mock_session1
         assert sessions["session2"] is mock_session2
 
-    @pytest.mark.asyncio
-    async def test_close_session(self, conversation_client):
-        """Test closing a conversation session."""
-        mock_session = MagicMock()
-        mock_session.close = AsyncMock()
-        conversation_client.active_sessions["test-session"] = mock_session
+    @_SESSION_LOOKUP
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_close_session(
+        self, conversation_client, mock_session, session_exists
+    ):
+        """Test closing an existing or unknown conversation session."""
+        if session_exists:
+            conversation_client.active_sessions["test-session"] = mock_session
 
         result = await conversation_client.close_session("test-session")
 
-        assert result.is_success
-        mock_session.close.assert_called_once()
-        assert "test-session" not in conversation_client.active_sessions
-
-    @pytest.mark.asyncio
-    async def test_close_session_not_found(self, conversation_client):
-        """Test closing non-existent session."""
-        result = await conversation_client.close_session("nonexistent")
-
-        assert result.is_failed
-        assert "not found" in result.error
-
-    @pytest.mark.asyncio
-    async def test_disconnect_from_servers(self, conversation_client):
+        if session_exists:
+            assert result.is_success
+            mock_session.close.assert_called_once()
+            assert "test-session" not in conversation_client.active_sessions
+        else:
+            assert result.is_failed
+            assert "not found" in result.error
+            mock_session.close.assert_not_called()
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_disconnect_from_servers(
+        self, conversation_client, mock_session, mock_pool
+    ):
         """Test disconnecting from all servers."""
         # Mock active sessions
-        mock_session = MagicMock()
-        mock_session.close = AsyncMock()
         conversation_client.active_sessions["test-session"] = mock_session
 
         # Mock connection pool
-        mock_pool = MagicMock()
         conversation_client.connection_pool = mock_pool
 
         with patch(
@@ -508,54 +593,63 @@ class TestCreateConversationClient:
             "server1": {"type": "sse", "url": "http://localhost:8001/mcp"},
         }
 
-    @pytest.mark.asyncio
-    async def test_create_conversation_client_success(self, sample_servers):
+    @pytest.fixture(scope="class")
+    def connect_patch(self):
+        """Patch connect_to_servers once for every test in the class."""
+        with patch.object(ConversationClient, "connect_to_servers") as mock_connect:
+            yield mock_connect
+
+    @pytest.fixture
+    def patched_connect(self, connect_patch):
+        """Provide the class-wide connect_to_servers patch, reset for this test."""
+        return _reset_template(connect_patch)
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_create_conversation_client_success(
+        self, sample_servers, patched_connect
+    ):
         """Test successful client creation."""
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
-            # Mock the connect_to_servers method
-            with patch.object(ConversationClient, "connect_to_servers") as mock_connect:
-                mock_connect.return_value = Result(
-                    status=OperationStatus.SUCCESS, data={"server1": True}
-                )
-
-                result = await create_conversation_client(
-                    servers=sample_servers,
-                    ai_provider="claude",
-                    max_steps=5,
-                )
+        patched_connect.return_value = success_with({"server1": True})
+
+        result = await create_conversation_client(
+            servers=sample_servers,
+            ai_provider="claude",
+            max_steps=5,
+        )
 
         assert result.is_success
         client = result.data
         assert isinstance(client, ConversationClient)
         assert client.max_steps == 5
 
-    @pytest.mark.asyncio
-    async def test_create_conversation_client_connection_failure(self, sample_servers):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_create_conversation_client_connection_failure(
+        self, sample_servers, patched_connect
+    ):
         """Test client creation with connection failure."""
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
-            # Mock connection failure
-            with patch.object(ConversationClient, "connect_to_servers") as mock_connect:
-                mock_connect.return_value = Result(
-                    status=OperationStatus.FAILED, error="Connection failed"
-                )
-
-                result = await create_conversation_client(
-                    servers=sample_servers,
-                    ai_provider="claude",
-                )
+        patched_connect.return_value = failure("Connection failed")
+
+        result = await create_conversation_client(
+            servers=sample_servers,
+            ai_provider="claude",
+        )
 
         assert result.is_failed
         assert "Connection failed" in result.error
 
-    @pytest.mark.asyncio
-    async def test_create_conversation_client_initialization_error(
-        self, sample_servers
-    ):
+
+class TestCreateConversationClientInitializationError:
+    """Tests for create_conversation_client when the client cannot be built."""
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_create_conversation_client_initialization_error(self):
         """Test client creation with initialization error."""
+        servers = {"server1": {"type": "sse", "url": "http://localhost:8001/mcp"}}
+
         # Missing API key should cause initialization error
         with patch.dict(os.environ, {}, clear=True):
             result = await create_conversation_client(
-                servers=sample_servers,
+                servers=servers,
                 ai_provider="claude",
             )
 
@@ -566,8 +660,7 @@ class TestCreateConversationClient:
 class TestConversationClientEdgeCases:
     """Test edge cases and error scenarios for ConversationClient."""
 
-    @pytest.mark.asyncio
-    async def test_conversation_client_with_custom_api_key(self):
+    def test_conversation_client_with_custom_api_key(self):
         """Test client with custom API key."""
         servers = {"server1": {"type": "sse", "url": "http://localhost:8001"}}
 
@@ -579,100 +672,70 @@ class TestConversationClientEdgeCases:
 
         assert client.api_key == "custom-key"
 
-    @pytest.mark.asyncio
-    async def test_conversation_client_with_different_providers(self):
+    def test_conversation_client_with_different_providers(self):
         """Test client with different AI providers."""
         servers = {"server1": {"type": "sse", "url": "http://localhost:8001"}}
 
         # Test Claude
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
-            claude_client = ConversationClient(servers=servers, ai_provider="claude")
-            assert claude_client.ai_provider.provider_name == "claude"
+        claude_client = ConversationClient(servers=servers, ai_provider="claude")
+        assert claude_client.ai_provider.provider_name == "claude"
 
         # Test OpenAI
-        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
-            openai_client = ConversationClient(servers=servers, ai_provider="openai")
-            assert openai_client.ai_provider.provider_name == "openai"
+        openai_client = ConversationClient(servers=servers, ai_provider="openai")
+        assert openai_client.ai_provider.provider_name == "openai"
 
-    @pytest.mark.asyncio
-    async def test_conversation_client_max_concurrent_tools(self):
+    def test_conversation_client_max_concurrent_tools(self):
         """Test client with different max concurrent tools settings."""
         servers = {"server1": {"type": "sse", "url": "http://localhost:8001"}}
 
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
-            client = ConversationClient(
-                servers=servers,
-                ai_provider="claude",
-                max_concurrent_tools=10,
-            )
+        client = ConversationClient(
+            servers=servers,
+            ai_provider="claude",
+            max_concurrent_tools=10,
+        )
 
         assert client.max_concurrent_tools == 10
         assert client.tool_executor.max_concurrent == 10
 
-    @pytest.mark.asyncio
-    async def test_start_conversation_initial_message_failure(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_start_conversation_initial_message_failure(
+        self, conversation_client, patched_session_class
+    ):
         """Test conversation start when initial message processing fails."""
-        servers = {"server1": {"type": "sse", "url": "http://localhost:8001"}}
-
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
-            client = ConversationClient(servers=servers, ai_provider="claude")
-
         # Mock session that fails on process_message
-        mock_session = MagicMock()
-        mock_session.session_id = "test-session"
-        mock_session.process_message = AsyncMock(
-            return_value=Result(
-                status=OperationStatus.FAILED, error="Processing failed"
-            )
+        mock_session = SimpleNamespace(
+            session_id="test-session",
+            process_message=async_return(_PROCESSING_FAILED),
         )
 
-        with patch(
-            "tools.ai.conversation_client.ConversationSession",
-            return_value=mock_session,
-        ):
-            result = await client.start_conversation(initial_message="Hello")
+        patched_session_class.return_value = mock_session
+
+        result = await conversation_client.start_conversation(initial_message="Hello")
 
         assert result.is_failed
         assert "Processing failed" in result.error
-        assert "test-session" not in client.active_sessions
+        assert "test-session" not in conversation_client.active_sessions
 
-    @pytest.mark.asyncio
-    async def test_chat_session_creation_failure(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_chat_session_creation_failure(self, conversation_client):
         """Test chat when session creation fails."""
-        servers = {"server1": {"type": "sse", "url": "http://localhost:8001"}}
-
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
-            client = ConversationClient(servers=servers, ai_provider="claude")
-
         # Mock failed session creation
-        with patch.object(client, "start_conversation") as mock_start:
-            mock_start.return_value = Result(
-                status=OperationStatus.FAILED, error="Session creation failed"
-            )
+        with patch.object(conversation_client, "start_conversation") as mock_start:
+            mock_start.return_value = failure("Session creation failed")
 
-            result = await client.chat("Hello")
+            result = await conversation_client.chat("Hello")
 
         assert result.is_failed
         assert "Session creation failed" in result.error
 
-    @pytest.mark.asyncio
-    async def test_chat_message_processing_failure(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_chat_message_processing_failure(self, conversation_client):
         """Test chat when message processing fails."""
-        servers = {"server1": {"type": "sse", "url": "http://localhost:8001"}}
-
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
-            client = ConversationClient(servers=servers, ai_provider="claude")
-
         # Mock session with failed processing
-        mock_session = MagicMock()
-        mock_session.process_message = AsyncMock(
-            return_value=Result(
-                status=OperationStatus.FAILED, error="Processing failed"
-            )
-        )
-        client.active_sessions["test-session"] = mock_session
+        mock_session = SimpleNamespace(process_message=async_return(_PROCESSING_FAILED))
+        conversation_client.active_sessions["test-session"] = mock_session
 
-        result = await client.chat("Hello", session_id="test-session")
+        result = await conversation_client.chat("Hello", session_id="test-session")
 
         assert result.is_failed
         assert "Processing failed" in result.error
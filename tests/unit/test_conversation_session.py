@@ -3,140 +3,224 @@ Comprehensive tests for ConversationSession - critical session management.
 """
 
 import asyncio
-from unittest.mock import AsyncMock
+import copy
+from types import MappingProxyType, SimpleNamespace
 
 import pytest
-
+import pytest_asyncio
+
+from tests.unit.conversation_helpers import (
+    MockMCPTool,
+    async_raise,
+    async_return,
+    failure,
+    success_with,
+)
 from tools.ai.conversation_session import ConversationSession
-from tools.common import (
-    ConversationStep,
-    OperationStatus,
-    Result,
-    ToolCall,
-    ToolResult,
+from tools.common import ConversationStep, ToolCall, ToolResult
+
+
+# Pure mock-based tests, selectable with -m unit_fast for quick local reruns
+pytestmark = pytest.mark.unit_fast
+
+# 100KB message, built once rather than on every run of the long-message test
+_LONG_MESSAGE = "x" * 100_000
+
+# Default executor output; the session only iterates over it
+_NO_TOOL_RESULTS = []
+
+# A tool call and its result, shared read-only by the tool-using tests
+_TOOL_CALL = ToolCall(id="call-1", tool_name="tool1", arguments={"param": "value"})
+_TOOL_RESULT = ToolResult(
+    id="call-1", tool_name="tool1", arguments={"param": "value"}, result="Tool output"
 )
 
+# Twenty read-only tool calls and matching results for the many-tools test
+_MANY_TOOL_CALLS = [
+    ToolCall(id=f"call-{i}", tool_name=f"tool{i}", arguments={}) for i in range(20)
+]
+_MANY_TOOL_RESULTS = [
+    ToolResult(id=f"call-{i}", tool_name=f"tool{i}", arguments={}, result=f"result{i}")
+    for i in range(20)
+]
+
+# Tool calls for the first two steps of the step-progression test, and the
+# single result its executor returns for each of them
+_PROGRESSION_TOOL_CALLS = [
+    ToolCall(id=f"call-{i}", tool_name="tool1", arguments={}) for i in range(2)
+]
+_PROGRESSION_TOOL_RESULT = ToolResult(
+    id="call-1", tool_name="tool1", arguments={}, result="result"
+)
+
+# Four read-only user/assistant exchanges for the summary test, which only counts
+# them; MappingProxyType keeps the repeated entries from being mutated in place
+_EIGHT_MESSAGES = tuple(
+    MappingProxyType({"role": role}) for role in ("user", "assistant") * 4
+)
+
+# Nested, mixed-type arguments; never mutated by the session, so shared as-is
+_COMPLEX_ARGS = {
+    "nested": {"key": "value", "number": 42},
+    "list": [1, 2, {"inner": "value"}],
+    "boolean": True,
+    "null": None,
+    "unicode": "测试",
+}
 
-class MockMCPTool:
-    """Mock MCP tool for testing."""
 
-    def __init__(self, name: str, description: str = "Mock tool"):
-        self.name = name
-        self.description = description
-        self.inputSchema = {"type": "object", "properties": {}}
+async def _mock_generate_step(messages, available_tools, step_number):
+    """Mock step generation."""
+    # A fresh step per call: the session sets duration_ms and appends tool
+    # results to it, and the constructor is cheaper than replace() anyway.
+    step = ConversationStep(step_number=step_number, text="Mock response")
+    return success_with(step)
 
 
 class MockAIProvider:
     """Mock AI provider for testing."""
 
+    # Tests rebind both attributes freely, so keep them as plain slots
+    __slots__ = ("provider_name", "generate_step")
+
     def __init__(self, provider_name: str = "mock"):
-        self.provider_name = provider_name
+        self.reset(provider_name)
 
-    async def generate_step(self, messages, available_tools, step_number):
-        """Mock step generation."""
-        step = ConversationStep(step_number=step_number, text="Mock response")
-        return Result(status=OperationStatus.SUCCESS, data=step)
+    def reset(self, provider_name: str = "mock"):
+        """Restore the default provider, dropping any per-test override."""
+        self.provider_name = provider_name
+        self.generate_step = _mock_generate_step
 
 
 class MockToolExecutor:
     """Mock tool executor for testing."""
 
     def __init__(self):
-        self.execute_tools_concurrently = AsyncMock(return_value=[])
+        self.reset()
+
+    def reset(self):
+        """Restore the default no-op execute, dropping any per-test override."""
+        self.execute_tools_concurrently = async_return(_NO_TOOL_RESULTS)
+
+
+# Shared by every fixture-built session; reset_shared_mocks restores them before
+# each test and tests override their methods, so this module is not safe to run in
+# threads (pytest-run-parallel). Use xdist's process workers instead.
+_AI_PROVIDER = MockAIProvider()
+_TOOL_EXECUTOR = MockToolExecutor()
+
+# The session only hands these to the provider, so one read-only set is enough
+_SAMPLE_TOOLS = {
+    "tool1": (MockMCPTool("tool1"), "server1"),
+    "tool2": (MockMCPTool("tool2"), "server2"),
+    "tool3": (MockMCPTool("tool3"), "server1"),
+}
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_mocks():
+    """Drop any override a previous test left on the shared mocks."""
+    _AI_PROVIDER.reset()
+    _TOOL_EXECUTOR.reset()
+
+
+@pytest_asyncio.fixture(loop_scope="session", autouse=True)
+async def no_leaked_tasks():
+    """Fail a test that leaves its own tasks pending on the shared session loop."""
+    already_running = asyncio.all_tasks()
+    yield
+    leaked = asyncio.all_tasks() - already_running - {asyncio.current_task()}
+    assert not leaked, f"test left pending tasks: {leaked}"
+
+
+@pytest.fixture(scope="module")
+def session_factory():
+    """Mint fresh sessions that reuse the shared mocks; kwargs override defaults."""
+
+    def make_session(**overrides):
+        options = {
+            "session_id": "factory-session",
+            "max_steps": 1,
+            "ai_provider": _AI_PROVIDER,
+            "tool_executor": _TOOL_EXECUTOR,
+            "available_tools": {},
+        }
+        options.update(overrides)
+        return ConversationSession(**options)
+
+    return make_session
+
+
+@pytest.fixture(scope="module")
+def session_prototype():
+    """Build one ConversationSession that per-test sessions are copied from."""
+    return ConversationSession(
+        session_id="test-session",
+        max_steps=5,
+        ai_provider=_AI_PROVIDER,
+        tool_executor=_TOOL_EXECUTOR,
+        available_tools=_SAMPLE_TOOLS,
+    )
+
+
+@pytest.fixture
+def conversation_session(session_prototype):
+    """Provide a fresh copy of the prototype session."""
+    session = copy.copy(session_prototype)
+    session.messages = []
+    session.steps = []
+    session.current_step_number = 0
+    session.is_complete = False
+    return session
 
 
 class TestConversationSession:
     """Comprehensive tests for ConversationSession class."""
 
-    @pytest.fixture
-    def mock_ai_provider(self):
-        """Create a mock AI provider."""
-        return MockAIProvider()
-
-    @pytest.fixture
-    def mock_tool_executor(self):
-        """Create a mock tool executor."""
-        return MockToolExecutor()
-
-    @pytest.fixture
-    def sample_tools(self):
-        """Create sample tools for testing."""
-        return {
-            "tool1": (MockMCPTool("tool1", "First tool"), "server1"),
-            "tool2": (MockMCPTool("tool2", "Second tool"), "server2"),
-            "tool3": (MockMCPTool("tool3", "Third tool"), "server1"),
-        }
-
-    @pytest.fixture
-    def conversation_session(self, mock_ai_provider, mock_tool_executor, sample_tools):
-        """Create a ConversationSession instance for testing."""
-        return ConversationSession(
+    def test_conversation_session_initialization(self):
+        """Test ConversationSession initialization."""
+        # Built directly: the conversation_session fixture resets the state
+        # checked here itself, so it cannot show what __init__ sets up
+        session = ConversationSession(
             session_id="test-session",
             max_steps=5,
-            ai_provider=mock_ai_provider,
-            tool_executor=mock_tool_executor,
-            available_tools=sample_tools,
-        )
-
-    def test_conversation_session_initialization(
-        self, conversation_session, mock_ai_provider, mock_tool_executor, sample_tools
-    ):
-        """Test ConversationSession initialization."""
-        assert conversation_session.session_id == "test-session"
-        assert conversation_session.max_steps == 5
-        assert conversation_session.ai_provider == mock_ai_provider
-        assert conversation_session.tool_executor == mock_tool_executor
-        assert conversation_session.available_tools == sample_tools
-        assert conversation_session.messages == []
-        assert conversation_session.steps == []
-        assert conversation_session.current_step_number == 0
-        assert conversation_session.is_complete is False
-
-    def test_conversation_session_initialization_with_defaults(self):
-        """Test ConversationSession initialization with minimal parameters."""
+            ai_provider=_AI_PROVIDER,
+            tool_executor=_TOOL_EXECUTOR,
+            available_tools=_SAMPLE_TOOLS,
+        )
+
+        assert session.session_id == "test-session"
+        assert session.max_steps == 5
+        assert session.ai_provider is _AI_PROVIDER
+        assert session.tool_executor is _TOOL_EXECUTOR
+        assert session.available_tools is _SAMPLE_TOOLS
+        assert session.messages == []
+        assert session.steps == []
+        assert session.current_step_number == 0
+        assert session.is_complete is False
+
+    @pytest.mark.parametrize("max_steps", [0, 3, 1000], ids=["zero", "small", "large"])
+    def test_conversation_session_initialization_max_steps(self, max_steps):
+        """Test ConversationSession keeps zero, small and large max_steps as given."""
         session = ConversationSession(
             session_id="minimal-session",
-            max_steps=3,
-            ai_provider=MockAIProvider(),
-            tool_executor=MockToolExecutor(),
+            max_steps=max_steps,
+            ai_provider=_AI_PROVIDER,
+            tool_executor=_TOOL_EXECUTOR,
             available_tools={},
         )
 
         assert session.session_id == "minimal-session"
-        assert session.max_steps == 3
+        assert session.max_steps == max_steps
         assert session.available_tools == {}
 
-    def test_conversation_session_initialization_with_large_max_steps(self):
-        """Test ConversationSession initialization with large max_steps."""
-        session = ConversationSession(
-            session_id="large-session",
-            max_steps=1000,
-            ai_provider=MockAIProvider(),
-            tool_executor=MockToolExecutor(),
-            available_tools={},
-        )
-
-        assert session.max_steps == 1000
-
-    def test_conversation_session_initialization_with_zero_max_steps(self):
-        """Test ConversationSession initialization with zero max_steps."""
-        session = ConversationSession(
-            session_id="zero-session",
-            max_steps=0,
-            ai_provider=MockAIProvider(),
-            tool_executor=MockToolExecutor(),
-            available_tools={},
-        )
-
-        assert session.max_steps == 0
-
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_process_message_success(self, conversation_session):
         """Test successful message processing."""
         # Mock AI provider to return a step
         mock_step = ConversationStep(step_number=0, text="Response to hello")
-        conversation_session.ai_provider.generate_step = AsyncMock(
-            return_value=Result(status=OperationStatus.SUCCESS, data=mock_step)
+        conversation_session.ai_provider.generate_step = async_return(
+            success_with(mock_step)
         )
 
         result = await conversation_session.process_message("Hello")
@@ -149,31 +233,22 @@ class TestConversationSession:
         assert conversation_session.messages[0]["role"] == "user"
         assert conversation_session.messages[0]["content"] == "Hello"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_process_message_with_tool_calls(self, conversation_session):
         """Test message processing with tool calls."""
         # Create step with tool calls and finish_reason to stop conversation
-        tool_call = ToolCall(
-            id="call-1", tool_name="tool1", arguments={"param": "value"}
-        )
         mock_step = ConversationStep(
-            step_number=0, text="Using tool", finish_reason="stop"
+            step_number=0,
+            text="Using tool",
+            finish_reason="stop",
+            tool_calls=[_TOOL_CALL],
         )
-        mock_step.tool_calls = [tool_call]
 
-        # Mock tool result
-        tool_result = ToolResult(
-            id="call-1",
-            tool_name="tool1",
-            arguments={"param": "value"},
-            result="Tool output",
-        )
-
-        conversation_session.ai_provider.generate_step = AsyncMock(
-            return_value=Result(status=OperationStatus.SUCCESS, data=mock_step)
+        conversation_session.ai_provider.generate_step = async_return(
+            success_with(mock_step)
         )
-        conversation_session.tool_executor.execute_tools_concurrently = AsyncMock(
-            return_value=[tool_result]
+        conversation_session.tool_executor.execute_tools_concurrently = async_return(
+            [_TOOL_RESULT]
         )
 
         result = await conversation_session.process_message("Use tool1")
@@ -185,41 +260,37 @@ class TestConversationSession:
         assert len(steps[0].tool_results) == 1
         assert steps[0].tool_results[0].result == "Tool output"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_process_message_multiple_steps(self, conversation_session):
         """Test message processing that generates multiple steps."""
         conversation_session.max_steps = 3
 
-        # Mock AI provider to return steps with tool calls that continue conversation
+        # Mock AI provider to return steps; tool calls on the first two continue it
         step_responses = [
-            ConversationStep(step_number=0, text="Step 1"),
-            ConversationStep(step_number=1, text="Step 2"),
+            ConversationStep(
+                step_number=0,
+                text="Step 1",
+                tool_calls=[ToolCall(id="call-1", tool_name="tool1", arguments={})],
+            ),
+            ConversationStep(
+                step_number=1,
+                text="Step 2",
+                tool_calls=[ToolCall(id="call-2", tool_name="tool2", arguments={})],
+            ),
             ConversationStep(step_number=2, text="Final step", finish_reason="stop"),
         ]
 
-        # Add tool calls to first two steps to continue conversation
-        step_responses[0].tool_calls = [
-            ToolCall(id="call-1", tool_name="tool1", arguments={})
-        ]
-        step_responses[1].tool_calls = [
-            ToolCall(id="call-2", tool_name="tool2", arguments={})
-        ]
-
         call_count = 0
 
         async def mock_generate_step(*args, **kwargs):
             nonlocal call_count
             step = step_responses[call_count]
             call_count += 1
-            return Result(status=OperationStatus.SUCCESS, data=step)
+            return success_with(step)
 
         conversation_session.ai_provider.generate_step = mock_generate_step
-        conversation_session.tool_executor.execute_tools_concurrently = AsyncMock(
-            return_value=[
-                ToolResult(
-                    id="call-1", tool_name="tool1", arguments={}, result="result"
-                )
-            ]
+        conversation_session.tool_executor.execute_tools_concurrently = async_return(
+            [ToolResult(id="call-1", tool_name="tool1", arguments={}, result="result")]
         )
 
         result = await conversation_session.process_message("Multi-step message")
@@ -229,24 +300,23 @@ class TestConversationSession:
         assert len(steps) == 3
         assert conversation_session.is_complete is True
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_process_message_max_steps_reached(self, conversation_session):
         """Test message processing when max steps is reached."""
         conversation_session.max_steps = 2
 
         # Mock AI provider to always return steps with tool calls (would continue indefinitely)
-        mock_step = ConversationStep(step_number=0, text="Continuing step")
-        mock_step.tool_calls = [ToolCall(id="call-1", tool_name="tool1", arguments={})]
+        mock_step = ConversationStep(
+            step_number=0,
+            text="Continuing step",
+            tool_calls=[ToolCall(id="call-1", tool_name="tool1", arguments={})],
+        )
 
-        conversation_session.ai_provider.generate_step = AsyncMock(
-            return_value=Result(status=OperationStatus.SUCCESS, data=mock_step)
+        conversation_session.ai_provider.generate_step = async_return(
+            success_with(mock_step)
         )
-        conversation_session.tool_executor.execute_tools_concurrently = AsyncMock(
-            return_value=[
-                ToolResult(
-                    id="call-1", tool_name="tool1", arguments={}, result="result"
-                )
-            ]
+        conversation_session.tool_executor.execute_tools_concurrently = async_return(
+            [ToolResult(id="call-1", tool_name="tool1", arguments={}, result="result")]
         )
 
         result = await conversation_session.process_message("Max steps test")
@@ -256,7 +326,7 @@ class TestConversationSession:
         assert len(steps) == 2  # Should stop at max_steps
         assert conversation_session.is_complete is True
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_process_message_already_complete(self, conversation_session):
         """Test processing message when session is already complete."""
         conversation_session.is_complete = True
@@ -266,13 +336,11 @@ class TestConversationSession:
         assert result.is_failed
         assert "already complete" in result.error
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_process_message_step_generation_failure(self, conversation_session):
         """Test message processing when step generation fails."""
-        conversation_session.ai_provider.generate_step = AsyncMock(
-            return_value=Result(
-                status=OperationStatus.FAILED, error="Generation failed"
-            )
+        conversation_session.ai_provider.generate_step = async_return(
+            failure("Generation failed")
         )
 
         result = await conversation_session.process_message("Failing message")
@@ -280,11 +348,11 @@ class TestConversationSession:
         assert result.is_failed
         assert "Failed to generate step" in result.error
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_process_message_exception_handling(self, conversation_session):
         """Test message processing with exception handling."""
-        conversation_session.ai_provider.generate_step = AsyncMock(
-            side_effect=Exception("Unexpected error")
+        conversation_session.ai_provider.generate_step = async_raise(
+            Exception("Unexpected error")
         )
 
         result = await conversation_session.process_message("Exception test")
@@ -292,12 +360,12 @@ class TestConversationSession:
         assert result.is_failed
         assert "Failed to generate step 0" in result.error
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_generate_step_success(self, conversation_session):
         """Test successful step generation."""
         mock_step = ConversationStep(step_number=0, text="Generated step")
-        conversation_session.ai_provider.generate_step = AsyncMock(
-            return_value=Result(status=OperationStatus.SUCCESS, data=mock_step)
+        conversation_session.ai_provider.generate_step = async_return(
+            success_with(mock_step)
         )
 
         result = await conversation_session._generate_step(0)
@@ -307,29 +375,21 @@ class TestConversationSession:
         assert step.text == "Generated step"
         assert step.duration_ms > 0
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_generate_step_with_tool_execution(self, conversation_session):
         """Test step generation with tool execution."""
         # Create step with tool calls
-        tool_call = ToolCall(
-            id="call-1", tool_name="tool1", arguments={"param": "value"}
+        mock_step = ConversationStep(
+            step_number=0, text="Step with tools", tool_calls=[_TOOL_CALL]
         )
-        mock_step = ConversationStep(step_number=0, text="Step with tools")
-        mock_step.tool_calls = [tool_call]
 
-        conversation_session.ai_provider.generate_step = AsyncMock(
-            return_value=Result(status=OperationStatus.SUCCESS, data=mock_step)
+        conversation_session.ai_provider.generate_step = async_return(
+            success_with(mock_step)
         )
 
         # Mock tool execution
-        tool_result = ToolResult(
-            id="call-1",
-            tool_name="tool1",
-            arguments={"param": "value"},
-            result="Tool executed",
-        )
-        conversation_session.tool_executor.execute_tools_concurrently = AsyncMock(
-            return_value=[tool_result]
+        conversation_session.tool_executor.execute_tools_concurrently = async_return(
+            [_TOOL_RESULT]
         )
 
         result = await conversation_session._generate_step(0)
@@ -338,26 +398,24 @@ class TestConversationSession:
         step = result.data
         assert len(step.tool_calls) == 1
         assert len(step.tool_results) == 1
-        assert step.tool_results[0].result == "Tool executed"
+        assert step.tool_results[0].result == "Tool output"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_generate_step_ai_provider_failure(self, conversation_session):
         """Test step generation when AI provider fails."""
-        conversation_session.ai_provider.generate_step = AsyncMock(
-            return_value=Result(
-                status=OperationStatus.FAILED, error="AI provider failed"
-            )
+        conversation_session.ai_provider.generate_step = async_return(
+            failure("AI provider failed")
         )
 
         result = await conversation_session._generate_step(0)
 
         assert result.is_failed
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_generate_step_exception(self, conversation_session):
         """Test step generation with exception."""
-        conversation_session.ai_provider.generate_step = AsyncMock(
-            side_effect=Exception("Step generation error")
+        conversation_session.ai_provider.generate_step = async_raise(
+            Exception("Step generation error")
         )
 
         result = await conversation_session._generate_step(0)
@@ -365,7 +423,7 @@ class TestConversationSession:
         assert result.is_failed
         assert "Error generating step" in result.error
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_update_conversation_messages_claude_format(
         self, conversation_session
     ):
@@ -373,19 +431,13 @@ class TestConversationSession:
         conversation_session.ai_provider.provider_name = "claude"
 
         # Create step with tool calls and results
-        tool_call = ToolCall(
-            id="call-1", tool_name="tool1", arguments={"param": "value"}
-        )
-        tool_result = ToolResult(
-            id="call-1",
-            tool_name="tool1",
-            arguments={"param": "value"},
-            result="Tool output",
-        )
 
-        step = ConversationStep(step_number=0, text="Using tool")
-        step.tool_calls = [tool_call]
-        step.tool_results = [tool_result]
+        step = ConversationStep(
+            step_number=0,
+            text="Using tool",
+            tool_calls=[_TOOL_CALL],
+            tool_results=[_TOOL_RESULT],
+        )
 
         await conversation_session._update_conversation_messages(step)
 
@@ -403,7 +455,7 @@ class TestConversationSession:
         assert isinstance(user_msg["content"], list)
         assert any(block["type"] == "tool_result" for block in user_msg["content"])
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_update_conversation_messages_claude_text_only(
         self, conversation_session
     ):
@@ -418,7 +470,7 @@ class TestConversationSession:
         assert conversation_session.messages[0]["role"] == "assistant"
         assert conversation_session.messages[0]["content"] == "Simple text response"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_update_conversation_messages_openai_format(
         self, conversation_session
     ):
@@ -426,19 +478,13 @@ class TestConversationSession:
         conversation_session.ai_provider.provider_name = "openai"
 
         # Create step with tool calls and results
-        tool_call = ToolCall(
-            id="call-1", tool_name="tool1", arguments={"param": "value"}
-        )
-        tool_result = ToolResult(
-            id="call-1",
-            tool_name="tool1",
-            arguments={"param": "value"},
-            result="Tool output",
-        )
 
-        step = ConversationStep(step_number=0, text="Using tool")
-        step.tool_calls = [tool_call]
-        step.tool_results = [tool_result]
+        step = ConversationStep(
+            step_number=0,
+            text="Using tool",
+            tool_calls=[_TOOL_CALL],
+            tool_results=[_TOOL_RESULT],
+        )
 
         await conversation_session._update_conversation_messages(step)
 
@@ -454,7 +500,7 @@ class TestConversationSession:
         assert tool_msg["role"] == "tool"
         assert tool_msg["tool_call_id"] == "call-1"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_update_conversation_messages_openai_text_only(
         self, conversation_session
     ):
@@ -469,7 +515,7 @@ class TestConversationSession:
         assert conversation_session.messages[0]["role"] == "assistant"
         assert conversation_session.messages[0]["content"] == "Simple text response"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_update_conversation_messages_generic_format(
         self, conversation_session
     ):
@@ -477,19 +523,13 @@ class TestConversationSession:
         conversation_session.ai_provider.provider_name = "unknown"
 
         # Create step with tool calls and results
-        tool_call = ToolCall(
-            id="call-1", tool_name="tool1", arguments={"param": "value"}
-        )
-        tool_result = ToolResult(
-            id="call-1",
-            tool_name="tool1",
-            arguments={"param": "value"},
-            result="Tool output",
-        )
 
-        step = ConversationStep(step_number=0, text="Using tool")
-        step.tool_calls = [tool_call]
-        step.tool_results = [tool_result]
+        step = ConversationStep(
+            step_number=0,
+            text="Using tool",
+            tool_calls=[_TOOL_CALL],
+            tool_results=[_TOOL_RESULT],
+        )
 
         await conversation_session._update_conversation_messages(step)
 
@@ -500,7 +540,7 @@ class TestConversationSession:
         assert "Tool calls executed: 1" in message["content"]
         assert "tool1: Tool output" in message["content"]
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_update_conversation_messages_generic_with_error(
         self, conversation_session
     ):
@@ -515,84 +555,70 @@ class TestConversationSession:
             error_code="TOOL_ERROR",
         )
 
-        step = ConversationStep(step_number=0, text="Tool failed")
-        step.tool_calls = [ToolCall(id="call-1", tool_name="tool1", arguments={})]
-        step.tool_results = [tool_result]
+        step = ConversationStep(
+            step_number=0,
+            text="Tool failed",
+            tool_calls=[ToolCall(id="call-1", tool_name="tool1", arguments={})],
+            tool_results=[tool_result],
+        )
 
         await conversation_session._update_conversation_messages(step)
 
         message = conversation_session.messages[0]
         assert "tool1: Error - Tool failed" in message["content"]
 
-    def test_format_tool_result_content_with_dict(self, conversation_session):
-        """Test formatting tool result content with dictionary result."""
+    @pytest.mark.parametrize(
+        "tool_output, expected",
+        [
+            (
+                {"result": {"key": "value", "number": 42}},
+                ('"key": "value"', '"number": 42'),
+            ),
+            ({"result": [1, 2, 3, "test"]}, ("[1, 2, 3", '"test"')),
+            ({"result": "Simple string result"}, "Simple string result"),
+            ({"error": "Tool execution failed"}, "Error: Tool execution failed"),
+            ({"result": None}, "No result"),
+            ({"result": ""}, ""),
+            ({"result": 0}, "0"),
+        ],
+        ids=["dict", "list", "string", "error", "none", "empty", "zero"],
+    )
+    def test_format_tool_result_content(self, session_prototype, tool_output, expected):
+        """Test formatting tool result content; tuples list expected fragments."""
         tool_result = ToolResult(
-            id="call-1",
-            tool_name="tool1",
-            arguments={},
-            result={"key": "value", "number": 42},
-        )
-
-        content = conversation_session._format_tool_result_content(tool_result)
-
-        assert '"key": "value"' in content
-        assert '"number": 42' in content
-
-    def test_format_tool_result_content_with_list(self, conversation_session):
-        """Test formatting tool result content with list result."""
-        tool_result = ToolResult(
-            id="call-1", tool_name="tool1", arguments={}, result=[1, 2, 3, "test"]
-        )
-
-        content = conversation_session._format_tool_result_content(tool_result)
-
-        assert "[1, 2, 3" in content
-        assert '"test"' in content
-
-    def test_format_tool_result_content_with_string(self, conversation_session):
-        """Test formatting tool result content with string result."""
-        tool_result = ToolResult(
-            id="call-1", tool_name="tool1", arguments={}, result="Simple string result"
-        )
-
-        content = conversation_session._format_tool_result_content(tool_result)
-
-        assert content == "Simple string result"
-
-    def test_format_tool_result_content_with_error(self, conversation_session):
-        """Test formatting tool result content with error."""
-        tool_result = ToolResult(
-            id="call-1", tool_name="tool1", arguments={}, error="Tool execution failed"
+            id="call-1", tool_name="tool1", arguments={}, **tool_output
         )
 
-        content = conversation_session._format_tool_result_content(tool_result)
-
-        assert content == "Error: Tool execution failed"
-
-    def test_format_tool_result_content_with_none(self, conversation_session):
-        """Test formatting tool result content with None result."""
-        tool_result = ToolResult(
-            id="call-1", tool_name="tool1", arguments={}, result=None
-        )
+        content = session_prototype._format_tool_result_content(tool_result)
 
-        content = conversation_session._format_tool_result_content(tool_result)
-
-        assert content == "No result"
+        if isinstance(expected, tuple):
+            for fragment in expected:
+                assert fragment in content
+        else:
+            assert content == expected
 
     def test_get_conversation_summary(self, conversation_session):
         """Test getting conversation summary."""
         # Add some mock steps with tool calls and results
-        step1 = ConversationStep(step_number=0, text="Step 1")
-        step1.tool_calls = [ToolCall(id="call-1", tool_name="tool1", arguments={})]
-        step1.tool_results = [
-            ToolResult(id="call-1", tool_name="tool1", arguments={}, result="success")
-        ]
+        step1 = ConversationStep(
+            step_number=0,
+            text="Step 1",
+            tool_calls=[ToolCall(id="call-1", tool_name="tool1", arguments={})],
+            tool_results=[
+                ToolResult(
+                    id="call-1", tool_name="tool1", arguments={}, result="success"
+                )
+            ],
+        )
 
-        step2 = ConversationStep(step_number=1, text="Step 2")
-        step2.tool_calls = [ToolCall(id="call-2", tool_name="tool2", arguments={})]
-        step2.tool_results = [
-            ToolResult(id="call-2", tool_name="tool2", arguments={}, error="failed")
-        ]
+        step2 = ConversationStep(
+            step_number=1,
+            text="Step 2",
+            tool_calls=[ToolCall(id="call-2", tool_name="tool2", arguments={})],
+            tool_results=[
+                ToolResult(id="call-2", tool_name="tool2", arguments={}, error="failed")
+            ],
+        )
 
         conversation_session.steps = [step1, step2]
         conversation_session.messages = [
@@ -620,7 +646,7 @@ class TestConversationSession:
         assert summary["total_tool_calls"] == 0
         assert summary["successful_tool_calls"] == 0
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_close_session(self, conversation_session):
         """Test closing a conversation session."""
         await conversation_session.close()
@@ -631,131 +657,54 @@ class TestConversationSession:
 class TestConversationSessionEdgeCases:
     """Test edge cases and error scenarios for ConversationSession."""
 
-    @pytest.mark.asyncio
-    async def test_conversation_session_with_empty_message(self):
-        """Test processing empty message."""
-        session = ConversationSession(
-            session_id="empty-test",
-            max_steps=1,
-            ai_provider=MockAIProvider(),
-            tool_executor=MockToolExecutor(),
-            available_tools={},
-        )
-
-        result = await session.process_message("")
-
-        assert result.is_success
-        assert session.messages[0]["content"] == ""
-
-    @pytest.mark.asyncio
-    async def test_conversation_session_with_very_long_message(self):
-        """Test processing very long message."""
-        session = ConversationSession(
-            session_id="long-test",
-            max_steps=1,
-            ai_provider=MockAIProvider(),
-            tool_executor=MockToolExecutor(),
-            available_tools={},
-        )
-
-        long_message = "x" * 100000  # 100KB message
-
-        result = await session.process_message(long_message)
-
-        assert result.is_success
-        assert session.messages[0]["content"] == long_message
-
-    @pytest.mark.asyncio
-    async def test_conversation_session_with_unicode_message(self):
-        """Test processing Unicode message."""
-        session = ConversationSession(
-            session_id="unicode-test",
-            max_steps=1,
-            ai_provider=MockAIProvider(),
-            tool_executor=MockToolExecutor(),
-            available_tools={},
-        )
-
-        unicode_message = "Hello 世界! 🌍 Здравствуй мир!"
-
-        result = await session.process_message(unicode_message)
-
-        assert result.is_success
-        assert session.messages[0]["content"] == unicode_message
-
-    @pytest.mark.asyncio
-    async def test_conversation_session_with_special_characters(self):
-        """Test processing message with special characters."""
-        session = ConversationSession(
-            session_id="special-test",
-            max_steps=1,
-            ai_provider=MockAIProvider(),
-            tool_executor=MockToolExecutor(),
-            available_tools={},
-        )
-
-        special_message = (
-            'Message with "quotes", \n newlines, \t tabs, and \\ backslashes'
-        )
-
-        result = await session.process_message(special_message)
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "",
+            _LONG_MESSAGE,
+            "Hello 世界! 🌍 Здравствуй мир!",
+            'Message with "quotes", \n newlines, \t tabs, and \\ backslashes',
+        ],
+        ids=["empty", "very_long", "unicode", "special_characters"],
+    )
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_conversation_session_message_content(self, session_factory, message):
+        """Test that unusual user messages are stored unchanged."""
+        session = session_factory()
+
+        result = await session.process_message(message)
 
         assert result.is_success
-        assert session.messages[0]["content"] == special_message
+        assert session.messages[0]["content"] == message
 
-    @pytest.mark.asyncio
-    async def test_conversation_session_step_without_text(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_conversation_session_step_without_text(self, session_factory):
         """Test processing step without text content."""
-        session = ConversationSession(
-            session_id="no-text-test",
-            max_steps=1,
-            ai_provider=MockAIProvider(),
-            tool_executor=MockToolExecutor(),
-            available_tools={},
-        )
+        session = session_factory()
 
         # Mock AI provider to return step without text
         mock_step = ConversationStep(step_number=0, text=None)
-        session.ai_provider.generate_step = AsyncMock(
-            return_value=Result(status=OperationStatus.SUCCESS, data=mock_step)
-        )
+        session.ai_provider.generate_step = async_return(success_with(mock_step))
 
         result = await session.process_message("Test")
 
         assert result.is_success
 
-    @pytest.mark.asyncio
-    async def test_conversation_session_with_many_tool_calls(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_conversation_session_with_many_tool_calls(self, session_factory):
         """Test processing step with many tool calls."""
-        session = ConversationSession(
-            session_id="many-tools-test",
-            max_steps=1,
-            ai_provider=MockAIProvider(),
-            tool_executor=MockToolExecutor(),
-            available_tools={},
-        )
+        session = session_factory()
 
         # Create step with many tool calls
-        tool_calls = [
-            ToolCall(id=f"call-{i}", tool_name=f"tool{i}", arguments={})
-            for i in range(20)
-        ]
-        mock_step = ConversationStep(step_number=0, text="Many tools")
-        mock_step.tool_calls = tool_calls
-
-        session.ai_provider.generate_step = AsyncMock(
-            return_value=Result(status=OperationStatus.SUCCESS, data=mock_step)
+        mock_step = ConversationStep(
+            step_number=0, text="Many tools", tool_calls=_MANY_TOOL_CALLS
         )
 
+        session.ai_provider.generate_step = async_return(success_with(mock_step))
+
         # Mock tool results
-        tool_results = [
-            ToolResult(
-                id=f"call-{i}", tool_name=f"tool{i}", arguments={}, result=f"result{i}"
-            )
-            for i in range(20)
-        ]
-        session.tool_executor.execute_tools_concurrently = AsyncMock(
-            return_value=tool_results
+        session.tool_executor.execute_tools_concurrently = async_return(
+            _MANY_TOOL_RESULTS
         )
 
         result = await session.process_message("Use many tools")
@@ -765,140 +714,110 @@ class TestConversationSessionEdgeCases:
         assert len(step.tool_calls) == 20
         assert len(step.tool_results) == 20
 
-    @pytest.mark.asyncio
-    async def test_conversation_session_tool_execution_failure(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_conversation_session_tool_execution_failure(self, session_factory):
         """Test handling tool execution failure."""
-        session = ConversationSession(
-            session_id="tool-fail-test",
-            max_steps=1,
-            ai_provider=MockAIProvider(),
-            tool_executor=MockToolExecutor(),
-            available_tools={},
-        )
+        session = session_factory()
 
         # Create step with tool call
         tool_call = ToolCall(id="call-1", tool_name="tool1", arguments={})
-        mock_step = ConversationStep(step_number=0, text="Using tool")
-        mock_step.tool_calls = [tool_call]
-
-        session.ai_provider.generate_step = AsyncMock(
-            return_value=Result(status=OperationStatus.SUCCESS, data=mock_step)
+        mock_step = ConversationStep(
+            step_number=0, text="Using tool", tool_calls=[tool_call]
         )
 
+        session.ai_provider.generate_step = async_return(success_with(mock_step))
+
         # Mock tool execution failure
-        session.tool_executor.execute_tools_concurrently = AsyncMock(
-            side_effect=Exception("Tool execution failed")
+        session.tool_executor.execute_tools_concurrently = async_raise(
+            Exception("Tool execution failed")
         )
 
-        # Should still succeed but handle the error gracefully
-        await session.process_message("Use failing tool")
+        # The exception is turned into a failed result rather than raised
+        result = await session.process_message("Use failing tool")
 
-        # The session should handle tool execution errors gracefully
-        # The exact behavior depends on implementation
+        assert result.is_failed
+        assert "Tool execution failed" in result.error
+        assert session.steps == []
+        assert session.is_complete is False
 
-    @pytest.mark.asyncio
-    async def test_conversation_session_with_complex_tool_arguments(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_conversation_session_with_complex_tool_arguments(
+        self, session_factory
+    ):
         """Test processing tool calls with complex arguments."""
-        session = ConversationSession(
-            session_id="complex-args-test",
-            max_steps=1,
-            ai_provider=MockAIProvider(),
-            tool_executor=MockToolExecutor(),
-            available_tools={},
-        )
+        session = session_factory()
 
-        # Create tool call with complex arguments
-        complex_args = {
-            "nested": {"key": "value", "number": 42},
-            "list": [1, 2, {"inner": "value"}],
-            "boolean": True,
-            "null": None,
-            "unicode": "测试",
-        }
-        tool_call = ToolCall(id="call-1", tool_name="tool1", arguments=complex_args)
-        mock_step = ConversationStep(step_number=0, text="Complex tool")
-        mock_step.tool_calls = [tool_call]
-
-        session.ai_provider.generate_step = AsyncMock(
-            return_value=Result(status=OperationStatus.SUCCESS, data=mock_step)
+        tool_call = ToolCall(id="call-1", tool_name="tool1", arguments=_COMPLEX_ARGS)
+        mock_step = ConversationStep(
+            step_number=0, text="Complex tool", tool_calls=[tool_call]
         )
 
+        session.ai_provider.generate_step = async_return(success_with(mock_step))
+
         tool_result = ToolResult(
             id="call-1",
             tool_name="tool1",
-            arguments=complex_args,
+            arguments=_COMPLEX_ARGS,
             result="Complex result",
         )
-        session.tool_executor.execute_tools_concurrently = AsyncMock(
-            return_value=[tool_result]
-        )
+        session.tool_executor.execute_tools_concurrently = async_return([tool_result])
 
         result = await session.process_message("Use complex tool")
 
         assert result.is_success
         step = result.data[0]
-        assert step.tool_calls[0].arguments == complex_args
+        assert step.tool_calls[0].arguments == _COMPLEX_ARGS
 
-    @pytest.mark.asyncio
-    async def test_conversation_session_duration_measurement(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_conversation_session_duration_measurement(
+        self, session_factory, monkeypatch
+    ):
         """Test that step duration is measured correctly."""
-        session = ConversationSession(
-            session_id="duration-test",
-            max_steps=1,
-            ai_provider=MockAIProvider(),
-            tool_executor=MockToolExecutor(),
-            available_tools={},
+        session = session_factory()
+        session.ai_provider.generate_step = async_return(
+            success_with(ConversationStep(step_number=0, text="Delayed response"))
         )
 
-        # Mock AI provider with delay
-        async def delayed_generate_step(*args, **kwargs):
-            await asyncio.sleep(0.1)  # 100ms delay
-            step = ConversationStep(step_number=0, text="Delayed response")
-            return Result(status=OperationStatus.SUCCESS, data=step)
-
-        session.ai_provider.generate_step = delayed_generate_step
+        # Replace the session's clock so the step appears to take exactly 100ms
+        # without actually sleeping.
+        monkeypatch.setattr(
+            "tools.ai.conversation_session.time",
+            SimpleNamespace(time=iter([0.0, 0.1]).__next__),
+        )
 
         result = await session.process_message("Delayed test")
 
         assert result.is_success
         step = result.data[0]
-        # Duration should be approximately 100ms (allow some variance)
-        assert 80 <= step.duration_ms <= 200
+        assert step.duration_ms == 100
 
-    @pytest.mark.asyncio
-    async def test_conversation_session_concurrent_processing(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_conversation_session_concurrent_processing(self, session_factory):
         """Test concurrent message processing (should be handled gracefully)."""
-        session = ConversationSession(
-            session_id="concurrent-test",
-            max_steps=1,
-            ai_provider=MockAIProvider(),
-            tool_executor=MockToolExecutor(),
-            available_tools={},
-        )
-
-        # Start multiple concurrent message processing
-        import asyncio
+        session = session_factory()
 
-        tasks = [session.process_message(f"Message {i}") for i in range(5)]
+        # Every call yields once before answering, so the tasks overlap
+        async def yield_then_answer(messages, available_tools, step_number):
+            await asyncio.sleep(0)
+            return await _mock_generate_step(messages, available_tools, step_number)
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        session.ai_provider.generate_step = yield_then_answer
 
-        # At least one should succeed, others might fail due to session state
-        successful_results = [
-            r for r in results if not isinstance(r, Exception) and r.is_success
+        tasks = [
+            asyncio.create_task(session.process_message(f"Message {i}"))
+            for i in range(5)
         ]
-        assert len(successful_results) >= 1
 
-    @pytest.mark.asyncio
-    async def test_conversation_session_step_number_progression(self):
+        # At least one should succeed, others might fail due to session state.
+        # process_message reports errors as failed Results rather than raising.
+        results = await asyncio.gather(*tasks)
+
+        assert any(result.is_success for result in results)
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_conversation_session_step_number_progression(self, session_factory):
         """Test that step numbers progress correctly."""
-        session = ConversationSession(
-            session_id="step-progression-test",
-            max_steps=3,
-            ai_provider=MockAIProvider(),
-            tool_executor=MockToolExecutor(),
-            available_tools={},
-        )
+        session = session_factory(max_steps=3)
 
         # Mock AI provider to return steps with tool calls (to continue conversation)
         call_count = 0
@@ -906,21 +825,19 @@ class TestConversationSessionEdgeCases:
         async def mock_generate_step(*args, **kwargs):
             nonlocal call_count
             step_number = kwargs.get("step_number", call_count)
-            step = ConversationStep(step_number=step_number, text=f"Step {step_number}")
-            if call_count < 2:  # Add tool calls to first two steps
-                step.tool_calls = [
-                    ToolCall(id=f"call-{call_count}", tool_name="tool1", arguments={})
-                ]
+            # Add tool calls to the first two steps
+            tool_calls = [_PROGRESSION_TOOL_CALLS[call_count]] if call_count < 2 else []
+            step = ConversationStep(
+                step_number=step_number,
+                text=f"Step {step_number}",
+                tool_calls=tool_calls,
+            )
             call_count += 1
-            return Result(status=OperationStatus.SUCCESS, data=step)
+            return success_with(step)
 
         session.ai_provider.generate_step = mock_generate_step
-        session.tool_executor.execute_tools_concurrently = AsyncMock(
-            return_value=[
-                ToolResult(
-                    id="call-1", tool_name="tool1", arguments={}, result="result"
-                )
-            ]
+        session.tool_executor.execute_tools_concurrently = async_return(
+            [_PROGRESSION_TOOL_RESULT]
         )
 
         result = await session.process_message("Multi-step test")
@@ -932,106 +849,67 @@ class TestConversationSessionEdgeCases:
         assert steps[1].step_number == 1
         assert steps[2].step_number == 2
 
-    @pytest.mark.asyncio
-    async def test_conversation_session_message_format_edge_cases(self):
-        """Test edge cases in message formatting."""
-        session = ConversationSession(
-            session_id="format-test",
-            max_steps=1,
-            ai_provider=MockAIProvider(),
-            tool_executor=MockToolExecutor(),
-            available_tools={},
-        )
-
-        # Test with different provider names
-        for provider_name in ["claude", "openai", "unknown", "", None]:
-            session.ai_provider.provider_name = provider_name
-            session.messages = []  # Reset messages
+    @pytest.mark.parametrize("provider_name", ["claude", "openai", "unknown", "", None])
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_conversation_session_message_format_edge_cases(
+        self, session_factory, provider_name
+    ):
+        """Test that every provider name yields at least one message."""
+        session = session_factory()
+        session.ai_provider.provider_name = provider_name
 
-            step = ConversationStep(step_number=0, text="Test response")
-            await session._update_conversation_messages(step)
+        step = ConversationStep(step_number=0, text="Test response")
+        await session._update_conversation_messages(step)
 
-            assert len(session.messages) >= 1
+        assert len(session.messages) >= 1
 
     def test_conversation_session_summary_with_complex_data(self):
         """Test conversation summary with complex step data."""
-        session = ConversationSession(
-            session_id="summary-test",
-            max_steps=10,
-            ai_provider=MockAIProvider(),
-            tool_executor=MockToolExecutor(),
-            available_tools={},
-        )
 
-        # Create steps with various combinations of tool calls and results
-        steps = []
-
-        # Step with successful tool call
-        step1 = ConversationStep(step_number=0, text="Step 1")
-        step1.tool_calls = [ToolCall(id="call-1", tool_name="tool1", arguments={})]
-        step1.tool_results = [
-            ToolResult(id="call-1", tool_name="tool1", arguments={}, result="success")
+        # Each step as (text, [(call id, tool name, succeeded), ...]), covering a
+        # successful call, a failed call, a mixed pair and no calls at all
+        step_specs = [
+            ("Step 1", [("call-1", "tool1", True)]),
+            ("Step 2", [("call-2", "tool2", False)]),
+            ("Step 3", [("call-3a", "tool3", True), ("call-3b", "tool4", False)]),
+            ("Step 4", []),
         ]
-        steps.append(step1)
 
-        # Step with failed tool call
-        step2 = ConversationStep(step_number=1, text="Step 2")
-        step2.tool_calls = [ToolCall(id="call-2", tool_name="tool2", arguments={})]
-        step2.tool_results = [
-            ToolResult(id="call-2", tool_name="tool2", arguments={}, error="failed")
-        ]
-        steps.append(step2)
+        def build_step(step_number, text, calls):
+            tool_calls = []
+            tool_results = []
+            for call_id, tool_name, succeeded in calls:
+                tool_calls.append(
+                    ToolCall(id=call_id, tool_name=tool_name, arguments={})
+                )
+                outcome = {"result": "success"} if succeeded else {"error": "failed"}
+                tool_results.append(
+                    ToolResult(id=call_id, tool_name=tool_name, arguments={}, **outcome)
+                )
+            return ConversationStep(
+                step_number=step_number,
+                text=text,
+                tool_calls=tool_calls,
+                tool_results=tool_results,
+            )
 
-        # Step with multiple tool calls
-        step3 = ConversationStep(step_number=2, text="Step 3")
-        step3.tool_calls = [
-            ToolCall(id="call-3a", tool_name="tool3", arguments={}),
-            ToolCall(id="call-3b", tool_name="tool4", arguments={}),
-        ]
-        step3.tool_results = [
-            ToolResult(id="call-3a", tool_name="tool3", arguments={}, result="success"),
-            ToolResult(id="call-3b", tool_name="tool4", arguments={}, error="failed"),
+        steps = [
+            build_step(i, text, calls) for i, (text, calls) in enumerate(step_specs)
         ]
-        steps.append(step3)
 
-        # Step with no tool calls
-        step4 = ConversationStep(step_number=3, text="Step 4")
-        steps.append(step4)
-
-        session.steps = steps
-        session.messages = [{"role": "user"}, {"role": "assistant"}] * 4  # 8 messages
+        # The summary only reads session state, so no provider or executor is
+        # needed; an attribute bag stands in for the session
+        session = SimpleNamespace(
+            session_id="summary-session",
+            steps=steps,
+            messages=_EIGHT_MESSAGES,
+            is_complete=False,
+            max_steps=10,
+        )
 
-        summary = session.get_conversation_summary()
+        summary = ConversationSession.get_conversation_summary(session)
 
         assert summary["steps"] == 4
         assert summary["messages"] == 8
         assert summary["total_tool_calls"] == 4  # 1 + 1 + 2 + 0
         assert summary["successful_tool_calls"] == 2  # 1 + 0 + 1 + 0
-
-    @pytest.mark.asyncio
-    async def test_conversation_session_with_none_values(self):
-        """Test conversation session handling None values gracefully."""
-        session = ConversationSession(
-            session_id="none-test",
-            max_steps=1,
-            ai_provider=MockAIProvider(),
-            tool_executor=MockToolExecutor(),
-            available_tools={},
-        )
-
-        # Test with step that has None text
-        mock_step = ConversationStep(step_number=0, text=None)
-        session.ai_provider.generate_step = AsyncMock(
-            return_value=Result(status=OperationStatus.SUCCESS, data=mock_step)
-        )
-
-        result = await session.process_message("None test")
-
-        assert result.is_success
-
-        # Test formatting None result
-        tool_result = ToolResult(
-            id="call-1", tool_name="tool1", arguments={}, result=None
-        )
-        content = session._format_tool_result_content(tool_result)
-        assert content == "No result"
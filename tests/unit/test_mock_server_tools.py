@@ -2,8 +2,7 @@
 Tests for the modular MockMCPServer tools.
 """
 
-import asyncio
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 import pytest
 
@@ -30,10 +29,8 @@ def mock_server():
 @pytest.mark.asyncio
 async def test_get_server_status(mock_server):
     """Unit test for the get_server_status tool."""
-    # Mock the FastMCP instance
-    mock_mcp = MagicMock()
-    mock_mcp.name = "test-mock"
-    mock_server.mcp = mock_mcp
+    # Stand in for the FastMCP instance; the tool only reads its name
+    mock_server.mcp = SimpleNamespace(name="test-mock")
 
     status = await get_server_status(ctx=None)
 
@@ -50,7 +47,6 @@ async def test_fetch_mock_data():
     delay = 0.01  # Use a very small delay for testing to keep tests fast
 
     result = await fetch_mock_data(ctx=None, data_id=data_id, delay_seconds=delay)
-    await asyncio.sleep(delay + 0.01)  # Ensure the mock delay has passed
 
     assert isinstance(result, dict)
     assert result.get("id") == data_id
@@ -69,7 +65,6 @@ async def test_execute_mock_action():
     result = await execute_mock_action(
         ctx=None, action_name=action_name, parameters=params, delay_seconds=delay
     )
-    await asyncio.sleep(delay + 0.01)  # Ensure the mock delay has passed
 
     assert isinstance(result, dict)
     assert result.get("action_name") == action_name
@@ -84,7 +79,6 @@ async def test_fetch_mock_data_default_delay():
     """Test fetch_mock_data with default delay."""
     data_id = "test-default-delay"
     result = await fetch_mock_data(ctx=None, data_id=data_id)
-    await asyncio.sleep(0.01)
 
     assert result.get("id") == data_id
     assert isinstance(result.get("details", {}), dict)
@@ -95,7 +89,6 @@ async def test_execute_mock_action_no_params():
     """Test execute_mock_action with no parameters and default delay."""
     action_name = "action_no_params"
     result = await execute_mock_action(ctx=None, action_name=action_name)
-    await asyncio.sleep(0.01)
 
     assert result.get("action_name") == action_name
     assert result.get("parameters_received") == {}
@@ -117,12 +110,6 @@ async def test_tool_integration_with_server(mock_server):
         assert "execute_mock_action" in tools
 
         # Test calling tools through the tools module functions
-        from lightfast_mcp.servers.mock.tools import (
-            execute_mock_action,
-            fetch_mock_data,
-            get_server_status,
-        )
-
         # Test get_server_status
         status = await get_server_status(ctx=None)
         assert status["status"] == "running"
@@ -265,26 +265,20 @@ class TestServerConfigValidation:
         server = MockMCPServer(config)
         assert server.default_delay == 0.5  # Should fallback to default
 
-    def test_server_config_edge_cases(self):
+    @pytest.mark.parametrize(
+        "config",
+        [{"type": "mock"}, {"type": "mock", "delay_seconds": None}],
+        ids=["empty", "none-values"],
+    )
+    def test_server_config_edge_cases(self, config):
         """Test servers with edge case configurations."""
-        # Test with empty config
-        empty_config = ServerConfig(
-            name="empty",
-            description="Empty config",
-            config={"type": "mock"},
-        )
-
-        server = MockMCPServer(empty_config)
-        assert server.default_delay == 0.5  # Default
-
-        # Test with None values
-        none_config = ServerConfig(
-            name="none-values",
-            description="None values",
-            config={"type": "mock", "delay_seconds": None},
+        edge_config = ServerConfig(
+            name="edge-case",
+            description="Edge case config",
+            config=config,
         )
 
-        server = MockMCPServer(none_config)
+        server = MockMCPServer(edge_config)
         assert server.default_delay == 0.5  # Default
 
     def test_server_string_representations(self):